@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+import os
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from loguru import logger
 from sqlalchemy.orm import Session
 
 from src.config_loader import load_config
-from src.models import get_engine, get_session_factory
+from src.models import get_read_engine, get_session_factory
 from src.repositories import SeriesRepository
+from src.repositories.series_repository import COUNT_MODES
 
 app = FastAPI(title="La Anonima Tracker API", version="1.1.0")
 
@@ -26,10 +30,25 @@ def _load_api_config():
 
 
 _config = _load_api_config()
-_engine = get_engine(_config)
+# Every endpoint is read-only, so API sessions go to the read replica when one
+# is configured.
+_engine = get_read_engine(_config)
 _SessionFactory = get_session_factory(_engine)
 
 
+def _resolve_count_mode(raw: Any) -> str:
+    mode = str(raw or "exact").strip()
+    if mode not in COUNT_MODES:
+        logger.warning(f"Invalid API count mode {mode!r}; expected one of {COUNT_MODES}. Falling back to 'exact'.")
+        return "exact"
+    return mode
+
+
+# Pagination totals: "exact" (default), "estimate" (PostgreSQL planner rows)
+# or "none".
+_COUNT_MODE = _resolve_count_mode(os.getenv("API_COUNT_MODE") or _config.get("api", {}).get("count_mode"))
+
+
 def get_session():
     session = _SessionFactory()
     try:
@@ -38,13 +57,28 @@ def get_session():
         session.close()
 
 
+def _json_default(value: Any) -> Any:
+    # Same conversions FastAPI's jsonable_encoder applies to repository rows.
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_response(payload: dict) -> Response:
+    """Serialize a listing payload in one pass, skipping jsonable_encoder's per-row copy."""
+    body = json.dumps(payload, default=_json_default, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    return Response(content=body.encode("utf-8"), media_type="application/json")
+
+
 def _validate_date_range(start_date: Optional[date], end_date: Optional[date]) -> None:
     if start_date and end_date and start_date > end_date:
         raise HTTPException(status_code=400, detail="El parametro 'from' no puede ser mayor a 'to'.")
 
 
 def _validate_period(period: Optional[str], label: str) -> None:
-    if period and len(period) != 7:
+    if period and (len(period) != 7 or period[4] != "-" or not (period[:4] + period[5:]).isdigit()):
         raise HTTPException(status_code=400, detail=f"El parametro '{label}' debe tener formato YYYY-MM.")
 
 
@@ -56,7 +90,7 @@ def _validate_period_range(from_period: Optional[str], to_period: Optional[str])
 
 
 def _official_meta(repository: SeriesRepository, region: str) -> dict:
-    latest = repository.get_latest_ipc_publication_status(basket_type="all", region=region)
+    latest = repository.get_latest_ipc_publication_source(basket_type="all", region=region)
     if not latest:
         return {
             "region": region,
@@ -84,20 +118,25 @@ def get_series_producto(
     to_date: Optional[date] = Query(default=None, alias="to"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=100, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None),
     session: Session = Depends(get_session),
 ):
     _validate_date_range(from_date, to_date)
 
-    repository = SeriesRepository(session)
-    rows, pagination = repository.get_product_series(
-        canonical_id=canonical_id,
-        start_date=from_date,
-        end_date=to_date,
-        page=page,
-        page_size=page_size,
-    )
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
+    try:
+        rows, pagination = repository.get_product_series(
+            canonical_id=canonical_id,
+            start_date=from_date,
+            end_date=to_date,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="El parametro 'cursor' es invalido.") from exc
 
-    return {"items": rows, "pagination": pagination.as_dict()}
+    return _json_response({"items": rows, "pagination": pagination.as_dict()})
 
 
 @app.get("/series/categoria")
@@ -107,23 +146,28 @@ def get_series_categoria(
     to_date: Optional[date] = Query(default=None, alias="to"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=100, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None),
     session: Session = Depends(get_session),
 ):
     _validate_date_range(from_date, to_date)
 
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     if not repository.category_exists(category):
         raise HTTPException(status_code=404, detail=f"Categoria inexistente: {category}")
 
-    rows, pagination = repository.get_category_series(
-        category=category,
-        start_date=from_date,
-        end_date=to_date,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        rows, pagination = repository.get_category_series(
+            category=category,
+            start_date=from_date,
+            end_date=to_date,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="El parametro 'cursor' es invalido.") from exc
 
-    return {"items": rows, "pagination": pagination.as_dict()}
+    return _json_response({"items": rows, "pagination": pagination.as_dict()})
 
 
 @app.get("/ipc/categorias")
@@ -132,18 +176,23 @@ def get_ipc_categorias(
     to_period: Optional[str] = Query(default=None, alias="to"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=100, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None),
     session: Session = Depends(get_session),
 ):
     """Legacy endpoint kept for backward compatibility."""
     _validate_period_range(from_period, to_period)
-    repository = SeriesRepository(session)
-    rows, pagination = repository.get_ipc_categories(
-        start_period=from_period,
-        end_period=to_period,
-        page=page,
-        page_size=page_size,
-    )
-    return {"items": rows, "pagination": pagination.as_dict()}
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
+    try:
+        rows, pagination = repository.get_ipc_categories(
+            start_period=from_period,
+            end_period=to_period,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="El parametro 'cursor' es invalido.") from exc
+    return _json_response({"items": rows, "pagination": pagination.as_dict()})
 
 
 @app.get("/ipc/tracker")
@@ -158,7 +207,7 @@ def get_ipc_tracker(
     session: Session = Depends(get_session),
 ):
     _validate_period_range(from_period, to_period)
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     rows, pagination = repository.get_tracker_ipc_general(
         basket_type=basket,
         start_period=from_period,
@@ -168,7 +217,7 @@ def get_ipc_tracker(
         page=page,
         page_size=page_size,
     )
-    return {"items": rows, "pagination": pagination.as_dict()}
+    return _json_response({"items": rows, "pagination": pagination.as_dict()})
 
 
 @app.get("/ipc/tracker/categorias")
@@ -184,7 +233,7 @@ def get_ipc_tracker_categorias(
     session: Session = Depends(get_session),
 ):
     _validate_period_range(from_period, to_period)
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     rows, pagination = repository.get_tracker_ipc_categories(
         basket_type=basket,
         category_slug=category,
@@ -195,7 +244,7 @@ def get_ipc_tracker_categorias(
         page=page,
         page_size=page_size,
     )
-    return {"items": rows, "pagination": pagination.as_dict()}
+    return _json_response({"items": rows, "pagination": pagination.as_dict()})
 
 
 @app.get("/ipc/oficial")
@@ -211,7 +260,7 @@ def get_ipc_oficial(
     session: Session = Depends(get_session),
 ):
     _validate_period_range(from_period, to_period)
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     rows, pagination = repository.get_official_ipc_patagonia(
         start_period=from_period,
         end_period=to_period,
@@ -222,7 +271,7 @@ def get_ipc_oficial(
         page=page,
         page_size=page_size,
     )
-    return {"items": rows, "pagination": pagination.as_dict(), "meta": _official_meta(repository, region=region)}
+    return _json_response({"items": rows, "pagination": pagination.as_dict(), "meta": _official_meta(repository, region=region)})
 
 
 @app.get("/ipc/oficial/patagonia")
@@ -262,7 +311,7 @@ def get_ipc_comparacion(
     session: Session = Depends(get_session),
 ):
     _validate_period_range(from_period, to_period)
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     rows, pagination = repository.get_ipc_comparison_general(
         basket_type=basket,
         start_period=from_period,
@@ -273,7 +322,7 @@ def get_ipc_comparacion(
         page=page,
         page_size=page_size,
     )
-    return {"items": rows, "pagination": pagination.as_dict(), "meta": {"region": region}}
+    return _json_response({"items": rows, "pagination": pagination.as_dict(), "meta": {"region": region}})
 
 
 @app.get("/ipc/comparacion/categorias")
@@ -290,7 +339,7 @@ def get_ipc_comparacion_categorias(
     session: Session = Depends(get_session),
 ):
     _validate_period_range(from_period, to_period)
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     rows, pagination = repository.get_ipc_comparison_categories(
         basket_type=basket,
         category_slug=category,
@@ -302,7 +351,7 @@ def get_ipc_comparacion_categorias(
         page=page,
         page_size=page_size,
     )
-    return {"items": rows, "pagination": pagination.as_dict(), "meta": {"region": region}}
+    return _json_response({"items": rows, "pagination": pagination.as_dict(), "meta": {"region": region}})
 
 
 @app.get("/ipc/publicacion/latest")
@@ -311,6 +360,6 @@ def get_ipc_publicacion_latest(
     region: str = Query(default="patagonia"),
     session: Session = Depends(get_session),
 ):
-    repository = SeriesRepository(session)
+    repository = SeriesRepository(session, count_mode=_COUNT_MODE)
     latest = repository.get_latest_ipc_publication_status(basket_type=basket, region=region)
     return {"item": latest}
@@ -3,7 +3,7 @@
 from typing import Dict
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.config_loader import get_category_display_names, resolve_canonical_category
 from src.models import Category, Price, Product
@@ -17,6 +17,7 @@ def backfill_canonical_categories(session: Session, config: Dict) -> Dict[str, i
     prices_updated = 0
     unresolved_products = 0
 
+    categories_by_slug = {category.slug: category for category in session.query(Category).all()}
     products = session.query(Product).all()
     for product in products:
         canonical_slug = resolve_canonical_category(config, product.category)
@@ -24,7 +25,7 @@ def backfill_canonical_categories(session: Session, config: Dict) -> Dict[str, i
             unresolved_products += 1
             continue
 
-        category_obj = session.query(Category).filter_by(slug=canonical_slug).first()
+        category_obj = categories_by_slug.get(canonical_slug)
         if not category_obj:
             category_obj = Category(
                 slug=canonical_slug,
@@ -33,6 +34,7 @@ def backfill_canonical_categories(session: Session, config: Dict) -> Dict[str, i
             )
             session.add(category_obj)
             session.flush()
+            categories_by_slug[canonical_slug] = category_obj
 
         if product.category_id != category_obj.id:
             product.category_id = category_obj.id
@@ -40,7 +42,13 @@ def backfill_canonical_categories(session: Session, config: Dict) -> Dict[str, i
 
     session.flush()
 
-    prices_missing = session.query(Price).filter(Price.category_id.is_(None)).all()
+    # Load the owning products in one extra query instead of one lazy load per price.
+    prices_missing = (
+        session.query(Price)
+        .options(selectinload(Price.product).load_only(Product.category_id))
+        .filter(Price.category_id.is_(None))
+        .all()
+    )
     for price in prices_missing:
         if price.product and price.product.category_id:
             price.category_id = price.product.category_id
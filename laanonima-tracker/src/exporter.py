@@ -325,11 +325,11 @@ def get_history_series(
 
     try:
         repository = SeriesRepository(session)
-        rows = repository.get_all_product_series(
+        rows = repository.iter_all_product_series(
             canonical_id=canonical_id,
             basket_type=basket_type,
         )
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame.from_records(rows)
 
         if not df.empty:
             df = df.sort_values(["canonical_id", "scraped_at"])
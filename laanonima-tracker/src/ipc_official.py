@@ -19,6 +19,7 @@ from sqlalchemy.orm import Session
 
 from src.config_loader import load_config
 from src.models import OfficialCPIMonthly, get_engine, get_session_factory, init_db, now_utc
+from src.repositories import SeriesRepository
 
 SPANISH_MONTHS = {
     "enero": 1,
@@ -37,6 +38,8 @@ SPANISH_MONTHS = {
 }
 
 GENERAL_CATEGORY_SENTINEL = "__general__"
+# Raw downloads and parsed snapshots are kept here for audit.
+RAW_SNAPSHOT_DIR = Path("data/cpi/raw")
 _LEGACY_MAPPING_WARNED = False
 
 
@@ -173,7 +176,7 @@ class INDECPatagoniaProvider(OfficialCPIProvider):
     @staticmethod
     def _persist_raw_blob(blob: bytes, suffix: str, prefix: str = "indec_raw") -> str:
         now = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        out_dir = Path("data/cpi/raw")
+        out_dir = RAW_SNAPSHOT_DIR
         out_dir.mkdir(parents=True, exist_ok=True)
         path = out_dir / f"{prefix}_{now}.{suffix}"
         path.write_bytes(blob)
@@ -182,7 +185,7 @@ class INDECPatagoniaProvider(OfficialCPIProvider):
     @staticmethod
     def _persist_raw_text(text: str, suffix: str, prefix: str = "indec_discovery") -> str:
         now = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        out_dir = Path("data/cpi/raw")
+        out_dir = RAW_SNAPSHOT_DIR
         out_dir.mkdir(parents=True, exist_ok=True)
         path = out_dir / f"{prefix}_{now}.{suffix}"
         path.write_text(text, encoding="utf-8")
@@ -768,7 +771,7 @@ def _persist_snapshot(df: pd.DataFrame, source_tag: str) -> Optional[str]:
     if df.empty:
         return None
     now = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    out_dir = Path("data/cpi/raw")
+    out_dir = RAW_SNAPSHOT_DIR
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"official_{source_tag}_{now}.csv"
     df.to_csv(path, index=False)
@@ -839,6 +842,7 @@ def _upsert_official_rows(
         upserted += 1
 
     session.commit()
+    SeriesRepository.invalidate_ipc_cache()
     return upserted
 
 
@@ -25,6 +25,7 @@ from src.models import (
     get_session_factory,
     init_db,
 )
+from src.repositories import SeriesRepository
 
 
 @dataclass
@@ -90,8 +91,11 @@ def _compute_comparison_metrics(
         tracker_q = tracker_q.filter(TrackerIPCMonthly.year_month <= to_month)
         official_q = official_q.filter(OfficialCPIMonthly.year_month <= to_month)
 
-    tracker_rows = [dict(r._mapping) for r in tracker_q.order_by(TrackerIPCMonthly.year_month.asc()).all()]
-    official_rows = [dict(r._mapping) for r in official_q.order_by(OfficialCPIMonthly.year_month.asc()).all()]
+    # The metrics below only read these rows, so RowMapping views are enough.
+    tracker_stmt = tracker_q.order_by(TrackerIPCMonthly.year_month.asc()).statement
+    official_stmt = official_q.order_by(OfficialCPIMonthly.year_month.asc()).statement
+    tracker_rows = session.execute(tracker_stmt).mappings().all()
+    official_rows = session.execute(official_stmt).mappings().all()
     if not tracker_rows or not official_rows:
         return {
             "overlap_months": 0,
@@ -333,6 +337,7 @@ def publish_ipc(
         run.metrics_json = json.dumps(metrics, ensure_ascii=False)
         run.completed_at = datetime.now(timezone.utc)
         session.commit()
+        SeriesRepository.invalidate_ipc_cache()
 
         return PublicationSummary(
             run_uuid=run_uuid,
@@ -358,6 +363,7 @@ def publish_ipc(
         run.metrics_json = json.dumps(metrics, ensure_ascii=False)
         run.completed_at = datetime.now(timezone.utc)
         session.commit()
+        SeriesRepository.invalidate_ipc_cache()
         raise
 
 
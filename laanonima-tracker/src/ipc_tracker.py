@@ -21,6 +21,7 @@ from src.models import (
     init_db,
     now_utc,
 )
+from src.repositories import SeriesRepository
 
 _LEGACY_MAPPING_WARNED = False
 
@@ -420,6 +421,7 @@ class TrackerIPCBuilder:
                 )
             upserted += 1
         self.session.commit()
+        SeriesRepository.invalidate_ipc_cache()
         return upserted
 
     def _upsert_categories(
@@ -474,6 +476,7 @@ class TrackerIPCBuilder:
                 )
             upserted += 1
         self.session.commit()
+        SeriesRepository.invalidate_ipc_cache()
         return upserted
 
     def build(
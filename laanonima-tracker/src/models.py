@@ -25,7 +25,7 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker, validates
 from sqlalchemy.sql import func
 
 Base = declarative_base()
@@ -73,17 +73,59 @@ class Product(Base):
     prices = relationship("Price", back_populates="product", cascade="all, delete-orphan")
     canonical_category = relationship("Category", back_populates="products")
     
+    @validates("category")
+    def _normalize_category(self, key, value):
+        # Stored lowercase so category lookups can use plain equality.
+        return value.strip().lower() if isinstance(value, str) else value
+
     def __repr__(self):
         return f"<Product(canonical_id='{self.canonical_id}', name='{self.name}')>"
 
 
+# Payload columns carried by the PostgreSQL covering indexes on prices so that
+# series/report reads can be answered with index-only scans.
+PRICE_SERIES_INDEX_INCLUDE = [
+    "current_price",
+    "product_name",
+    "product_url",
+    "product_size",
+    "original_price",
+    "price_per_unit",
+    "in_stock",
+    "is_promotion",
+]
+PRICE_CANONICAL_INDEX_INCLUDE = ["current_price", "basket_id"]
+PRICE_CANDIDATE_INDEX_INCLUDE = [
+    "tier",
+    "candidate_rank",
+    "candidate_price",
+    "confidence_score",
+    "is_selected",
+    "is_fallback",
+]
+
+
 class Price(Base):
     """Price observations table (long format)."""
     
     __tablename__ = "prices"
     __table_args__ = (
-        Index("ix_prices_canonical_scraped_at", "canonical_id", "scraped_at"),
-        Index("ix_prices_basket_scraped_at", "basket_id", "scraped_at"),
+        Index(
+            "ix_prices_canonical_scraped_cover",
+            "canonical_id",
+            "scraped_at",
+            postgresql_include=PRICE_CANONICAL_INDEX_INCLUDE,
+        ),
+        # Single covering index for range reads: a handful of basket ids makes
+        # the basket filter cheap inside the scraped_at range, and it also
+        # serves the unfiltered ("all") reads a basket-leading key cannot seek.
+        Index(
+            "ix_prices_scraped_basket_canonical",
+            "scraped_at",
+            "basket_id",
+            "canonical_id",
+            postgresql_include=PRICE_SERIES_INDEX_INCLUDE,
+        ),
     )
     
     id = Column(Integer, primary_key=True)
@@ -148,6 +190,13 @@ class PriceCandidate(Base):
     __table_args__ = (
         Index("ix_price_candidates_run_canonical", "run_id", "canonical_id"),
         Index("ix_price_candidates_canonical_scraped_at", "canonical_id", "scraped_at"),
+        Index(
+            "ix_price_candidates_basket_scraped_canonical",
+            "basket_id",
+            "scraped_at",
+            "canonical_id",
+            postgresql_include=PRICE_CANDIDATE_INDEX_INCLUDE,
+        ),
     )
 
     id = Column(Integer, primary_key=True)
@@ -566,11 +615,25 @@ def get_engine(config: dict, backend: Optional[str] = None):
         raise ValueError(f"Unsupported database backend: {backend}")
 
 
+def get_read_engine(config: dict, backend: Optional[str] = None):
+    """Create the engine for read-only traffic.
+
+    Uses ``READ_REPLICA_URL`` (or ``storage.postgresql.read_replica_url``) when
+    configured and falls back to the primary engine otherwise.
+    """
+    pg_config = config.get("storage", {}).get("postgresql", {})
+    replica_url = str(os.getenv("READ_REPLICA_URL") or pg_config.get("read_replica_url") or "").strip()
+    if replica_url:
+        return create_engine(replica_url)
+    return get_engine(config, backend)
+
+
 def init_db(engine):
     """Initialize database tables."""
     Base.metadata.create_all(engine)
     _ensure_category_columns(engine)
     _ensure_ipc_schema_columns(engine)
+    _normalize_product_categories(engine)
     _ensure_runtime_indexes(engine)
 
 
@@ -639,19 +702,58 @@ def _ensure_ipc_schema_columns(engine):
         )
 
 
+def _normalize_product_categories(engine):
+    """Lowercase product categories written before they were normalized on assignment.
+
+    A read-only EXISTS probe runs first, so an already-normalized database
+    costs one cheap query per start instead of a write transaction.
+    """
+    pending_filter = "category IS NOT NULL AND category <> lower(trim(category))"
+    with engine.connect() as conn:
+        pending = conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM products WHERE {pending_filter})")).scalar()
+    if not pending:
+        return
+    with engine.begin() as conn:
+        conn.execute(text(f"UPDATE products SET category = lower(trim(category)) WHERE {pending_filter}"))
+
+
 def _ensure_runtime_indexes(engine):
     """Create performance indexes if they do not exist."""
+    # SQLite has no INCLUDE clause; the key columns alone still serve the
+    # scraped_at range filter there.
+    include_clause = ""
+    canonical_include_clause = ""
+    candidate_include_clause = ""
+    if engine.dialect.name == "postgresql":
+        include_clause = f" INCLUDE ({', '.join(PRICE_SERIES_INDEX_INCLUDE)})"
+        canonical_include_clause = f" INCLUDE ({', '.join(PRICE_CANONICAL_INDEX_INCLUDE)})"
+        candidate_include_clause = f" INCLUDE ({', '.join(PRICE_CANDIDATE_INDEX_INCLUDE)})"
     with engine.begin() as conn:
+        # The covering variant has its own name so databases created before it
+        # existed get the INCLUDE columns too; the plain index it replaces is dropped.
+        conn.execute(text("DROP INDEX IF EXISTS ix_prices_canonical_scraped_at"))
         conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS ix_prices_canonical_scraped_at "
-                "ON prices (canonical_id, scraped_at)"
+                "CREATE INDEX IF NOT EXISTS ix_prices_canonical_scraped_cover "
+                f"ON prices (canonical_id, scraped_at){canonical_include_clause}"
             )
         )
+        # Range reads share the scraped_at-leading index below; the older
+        # basket-leading indexes would only double write cost on prices.
+        conn.execute(text("DROP INDEX IF EXISTS ix_prices_basket_scraped_at"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_prices_basket_scraped_canonical"))
         conn.execute(
             text(
-                "CREATE INDEX IF NOT EXISTS ix_prices_basket_scraped_at "
-                "ON prices (basket_id, scraped_at)"
+                "CREATE INDEX IF NOT EXISTS ix_prices_scraped_basket_canonical "
+                f"ON prices (scraped_at, basket_id, canonical_id){include_clause}"
+            )
+        )
+        # Categories are stored lowercase, so lookups use plain equality.
+        conn.execute(text("DROP INDEX IF EXISTS ix_products_category_lower"))
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_products_category "
+                "ON products (category)"
             )
         )
         conn.execute(
@@ -666,6 +768,12 @@ def _ensure_runtime_indexes(engine):
                 "ON price_candidates (canonical_id, scraped_at)"
             )
         )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_price_candidates_basket_scraped_canonical "
+                f"ON price_candidates (basket_id, scraped_at, canonical_id){candidate_include_clause}"
+            )
+        )
         conn.execute(
             text(
                 "CREATE INDEX IF NOT EXISTS ix_official_cpi_monthly_region_month "
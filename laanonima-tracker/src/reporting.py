@@ -29,7 +29,9 @@ class ReportArtifacts:
 
 
 PUBLICATION_POLICY = "publish_with_alert_on_partial"
+PRODUCT_DETAILS_FILENAME = "products.jsonl"
 _LEGACY_MAPPING_WARNED = False
+_HISTORY_FROM_MONTH = "2024-01"
 
 
 class ReportGenerator:
@@ -37,6 +39,9 @@ class ReportGenerator:
         self.config = config
         engine = get_engine(config)
         self.session = get_session_factory(engine)()
+        public_base_url = self._public_base_url()
+        self._escaped_tracker_url = escape(f"{public_base_url}/tracker/", quote=True)
+        self._escaped_og_image_url = escape(f"{public_base_url}/assets/og-card.svg", quote=True)
 
     def close(self):
         self.session.close()
@@ -93,12 +98,21 @@ class ReportGenerator:
 
     def _load_prices(self, from_month: str, to_month: str, basket_type: str) -> pd.DataFrame:
         repository = SeriesRepository(self.session)
-        rows = repository.get_report_rows(
-            basket_type=basket_type,
-            start_dt=self._month_start(from_month).to_pydatetime(),
-            end_exclusive_dt=self._next_month_start(to_month).to_pydatetime(),
-        )
-        df = pd.DataFrame(rows)
+        analysis_cfg = self.config.get("analysis", {}) if isinstance(self.config.get("analysis"), dict) else {}
+        start_dt = self._month_start(from_month).to_pydatetime()
+        end_exclusive_dt = self._next_month_start(to_month).to_pydatetime()
+        # An empty range is answered by one EXISTS probe instead of the full
+        # report query and category map load.
+        if repository.has_report_data(basket_type, start_dt, end_exclusive_dt):
+            columns = repository.get_report_columns(
+                basket_type=basket_type,
+                start_dt=start_dt,
+                end_exclusive_dt=end_exclusive_dt,
+                granularity=str(analysis_cfg.get("report_price_granularity", "raw")),
+            )
+        else:
+            columns = {}
+        df = pd.DataFrame(columns)
         if df.empty:
             return pd.DataFrame(
                 columns=[
@@ -127,15 +141,16 @@ class ReportGenerator:
     def _load_candidate_rows(self, from_month: str, to_month: str, basket_type: str) -> pd.DataFrame:
         repository = SeriesRepository(self.session)
         try:
-            rows = repository.get_candidate_rows(
+            rows = repository.iter_candidate_rows(
                 basket_type=basket_type,
                 start_dt=self._month_start(from_month).to_pydatetime(),
                 end_exclusive_dt=self._next_month_start(to_month).to_pydatetime(),
             )
+            # Rows are fetched while the frame is built, so errors surface here.
+            df = pd.DataFrame.from_records(rows)
         except Exception:
-            rows = []
+            df = pd.DataFrame()
 
-        df = pd.DataFrame(rows)
         if df.empty:
             return pd.DataFrame(
                 columns=[
@@ -179,6 +194,7 @@ class ReportGenerator:
                 region=region,
                 page=1,
                 page_size=2400,
+                count=False,
             )
         except Exception:
             rows = []
@@ -253,6 +269,7 @@ class ReportGenerator:
                 end_period=to_month,
                 page=1,
                 page_size=2400,
+                count=False,
             )
         except Exception:
             rows = []
@@ -286,6 +303,7 @@ class ReportGenerator:
                 end_period=to_month,
                 page=1,
                 page_size=10000,
+                count=False,
             )
         except Exception:
             rows = []
@@ -569,6 +587,8 @@ class ReportGenerator:
                 region=region,
                 page=1,
                 page_size=10000,
+                count=False,
+                exclude_metric_codes=("general",),
             )
         except Exception:
             rows = []
@@ -1900,8 +1920,11 @@ class ReportGenerator:
         generated_at: str,
         analysis_depth: str = "executive",
         offline_assets: str = "embed",
+        payload_json: Optional[str] = None,
     ) -> str:
-        payload_json = json.dumps(payload, ensure_ascii=False).replace("</", "<\\/")
+        if payload_json is None:
+            payload_json = json.dumps(payload, ensure_ascii=False)
+        payload_json = payload_json.replace("</", "<\\/")
         external_script = ""
         tracker_style_block = f"<style>{get_tracker_css_bundle()}</style>"
         if offline_assets == "external":
@@ -1932,9 +1955,6 @@ class ReportGenerator:
                 f"crossorigin=\"anonymous\"></script>"
             )
 
-        tracker_url = f"{self._public_base_url()}/tracker/"
-        og_image_url = f"{self._public_base_url()}/assets/og-card.svg"
-
         # Read HTML and JS templates from src/templates/
         template_dir = Path(__file__).parent / 'templates'
         template_html = (template_dir / 'tracker.html').read_text(encoding='utf-8')
@@ -1949,8 +1969,8 @@ class ReportGenerator:
             .replace("__ADSENSE_SCRIPT__", adsense_script)
             .replace("__ANALYTICS_SCRIPT__", analytics_script)
             .replace("__TRACKER_STYLE_BLOCK__", tracker_style_block)
-            .replace("__TRACKER_URL__", escape(tracker_url, quote=True))
-            .replace("__OG_IMAGE_URL__", escape(og_image_url, quote=True))
+            .replace("__TRACKER_URL__", self._escaped_tracker_url)
+            .replace("__OG_IMAGE_URL__", self._escaped_og_image_url)
             .replace("__GEN__", generated_at)
             .replace("__FROM__", payload["from_month"])
             .replace("__TO__", payload["to_month"])
@@ -1966,6 +1986,87 @@ class ReportGenerator:
         HTML(string=html_content).write_pdf(str(pdf_path))
         return str(pdf_path)
 
+    def _write_product_details(
+        self,
+        products_dir: Path,
+        payload: Dict[str, Any],
+        full_payload: Dict[str, Any],
+    ) -> None:
+        """Write per-product detail records alongside the tracker HTML.
+
+        Records go to a single JSON Lines file (one product per line) that
+        web_publish.py reads to generate /tracker/{id}/index.html pages.
+        """
+        snapshot_by_id = {str(s.get('canonical_id') or ''): s for s in (payload.get('snapshot') or []) if s.get('canonical_id')}
+        if not snapshot_by_id:
+            return
+        products_dir.mkdir(parents=True, exist_ok=True)
+
+        timeline_by_id = {}
+        for t in (full_payload.get('timeline') or []):
+            cid = str(t.get('canonical_id') or '')
+            if cid:
+                timeline_by_id.setdefault(cid, []).append(t)
+
+        monthly_by_id = {}
+        for m in (full_payload.get('monthly_reference') or []):
+            cid = str(m.get('canonical_id') or '')
+            if cid:
+                monthly_by_id.setdefault(cid, []).append(m)
+
+        bands_by_id = {}
+        for b in (full_payload.get('candidate_bands') or []):
+            cid = str(b.get('canonical_id') or '')
+            if cid:
+                bands_by_id.setdefault(cid, []).append(b)
+
+        triplets_by_id = full_payload.get('candidate_triplets_latest_by_id') or {}
+
+        to_month = payload.get('to_month')
+        generated_at = payload.get('generated_at')
+        safe_float = self._safe_float
+        failed = 0
+        with (products_dir / PRODUCT_DETAILS_FILENAME).open("w", encoding="utf-8") as handle:
+            for cid, snap in snapshot_by_id.items():
+                try:
+                    pd_data = {
+                        'canonical_id': cid,
+                        'product_name': snap.get('product_name') or cid,
+                        'category': snap.get('category') or '',
+                        'basket_id': snap.get('basket_id') or '',
+                        'presentation': snap.get('presentation') or '',
+                        'product_url': snap.get('product_url'),
+                        'from_month': _HISTORY_FROM_MONTH,
+                        'to_month': to_month,
+                        'generated_at': generated_at,
+                        'current_price': snap.get('current_price'),
+                        'current_real_price': snap.get('current_real_price'),
+                        'scraped_at': snap.get('scraped_at'),
+                        'monthly_series': sorted(monthly_by_id.get(cid, []), key=lambda x: str(x.get('month') or '')),
+                        'daily_series': sorted(timeline_by_id.get(cid, []), key=lambda x: str(x.get('scraped_at') or '')),
+                        'terna_series': sorted(bands_by_id.get(cid, []), key=lambda x: str(x.get('scraped_at') or '')),
+                        'terna_latest': triplets_by_id.get(cid, {}),
+                    }
+                    monthly = pd_data['monthly_series']
+                    if len(monthly) >= 2:
+                        p0 = safe_float(monthly[0].get('avg_price'))
+                        p1 = safe_float(monthly[-1].get('avg_price'))
+                        pd_data['var_pct'] = round((p1 / p0 - 1) * 100, 2) if p0 and p0 > 0 and p1 is not None else None
+                        r0 = safe_float(monthly[0].get('avg_real_price'))
+                        r1 = safe_float(monthly[-1].get('avg_real_price'))
+                        pd_data['var_real_pct'] = round((r1 / r0 - 1) * 100, 2) if r0 and r0 > 0 and r1 is not None else None
+                    else:
+                        pd_data['var_pct'] = None
+                        pd_data['var_real_pct'] = None
+
+                    handle.write(json.dumps(pd_data, ensure_ascii=False))
+                    handle.write("\n")
+                except Exception as exc:
+                    failed += 1
+                    logger.warning("Product detail write failed for {}: {}", cid, exc)
+        if failed:
+            logger.warning("Product details: {} of {} failed", failed, len(snapshot_by_id))
+
     def generate(
         self,
         from_month: Optional[str] = None,
@@ -1997,103 +2098,39 @@ class ReportGenerator:
         )
         out_dir = Path(str(reports_dir))
         out_dir.mkdir(parents=True, exist_ok=True)
-        generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        now = datetime.now(timezone.utc)
+        generated_at = now.strftime("%Y-%m-%d %H:%M:%S UTC")
+        stamp = now.strftime("%Y%m%d_%H%M%S")
         base = f"report_interactive_{effective_from}_to_{effective_to}_{stamp}".replace("-", "")
 
         # Load ALL historical data for product detail pages and main tracker sparklines
-        try:
-            full_df = self._load_prices("2024-01", effective_to, basket_type)
-            full_payload = self._build_interactive_payload(full_df, "2024-01", effective_to, basket_type)
+        if effective_from == _HISTORY_FROM_MONTH:
+            full_payload = payload
+        else:
+            full_df = self._load_prices(_HISTORY_FROM_MONTH, effective_to, basket_type)
+            full_payload = self._build_interactive_payload(full_df, _HISTORY_FROM_MONTH, effective_to, basket_type)
             # Override dashboard monthly_reference so it contains up to 6 months of data for inline sparklines
             payload["monthly_reference"] = full_payload["monthly_reference"]
-        except Exception:
-            full_df = df
-            full_payload = payload
 
+        payload_json = json.dumps(payload, ensure_ascii=False)
         html = self._render_interactive_html(
             payload,
             generated_at,
             analysis_depth=analysis_depth,
             offline_assets=offline_assets,
+            payload_json=payload_json,
         )
         html_path = out_dir / f"{base}.html"
-        html_path.write_text(html, encoding="utf-8")
+        html_path.write_bytes(html.encode("utf-8"))
 
-        # Write per-product detail JSON files alongside the tracker HTML.
-        # web_publish.py reads these to generate /tracker/{id}/index.html pages.
-        try:
-            products_dir = out_dir / "products"
-            products_dir.mkdir(parents=True, exist_ok=True)
-            
-            snapshot_by_id = {str(s.get('canonical_id') or ''): s for s in (payload.get('snapshot') or []) if s.get('canonical_id')}
-            
-            timeline_by_id = {}
-            for t in (full_payload.get('timeline') or []):
-                cid = str(t.get('canonical_id') or '')
-                if cid:
-                    timeline_by_id.setdefault(cid, []).append(t)
-                    
-            monthly_by_id = {}
-            for m in (full_payload.get('monthly_reference') or []):
-                cid = str(m.get('canonical_id') or '')
-                if cid:
-                    monthly_by_id.setdefault(cid, []).append(m)
-                    
-            bands_by_id = {}
-            for b in (full_payload.get('candidate_bands') or []):
-                cid = str(b.get('canonical_id') or '')
-                if cid:
-                    bands_by_id.setdefault(cid, []).append(b)
-                    
-            triplets_by_id = full_payload.get('candidate_triplets_latest_by_id') or {}
-            
-            for cid, snap in snapshot_by_id.items():
-                if not cid:
-                    continue
-                pd_data = {
-                    'canonical_id': cid,
-                    'product_name': snap.get('product_name') or cid,
-                    'category': snap.get('category') or '',
-                    'basket_id': snap.get('basket_id') or '',
-                    'presentation': snap.get('presentation') or '',
-                    'product_url': snap.get('product_url'),
-                    'from_month': '2024-01',
-                    'to_month': payload.get('to_month'),
-                    'generated_at': payload.get('generated_at'),
-                    'current_price': snap.get('current_price'),
-                    'current_real_price': snap.get('current_real_price'),
-                    'scraped_at': snap.get('scraped_at'),
-                    'monthly_series': sorted(monthly_by_id.get(cid, []), key=lambda x: str(x.get('month') or '')),
-                    'daily_series': sorted(timeline_by_id.get(cid, []), key=lambda x: str(x.get('scraped_at') or '')),
-                    'terna_series': sorted(bands_by_id.get(cid, []), key=lambda x: str(x.get('scraped_at') or '')),
-                    'terna_latest': triplets_by_id.get(cid, {}),
-                }
-                monthly = pd_data['monthly_series']
-                if len(monthly) >= 2:
-                    p0 = self._safe_float(monthly[0].get('avg_price'))
-                    p1 = self._safe_float(monthly[-1].get('avg_price'))
-                    pd_data['var_pct'] = round((p1 / p0 - 1) * 100, 2) if p0 and p0 > 0 and p1 is not None else None
-                    r0 = self._safe_float(monthly[0].get('avg_real_price'))
-                    r1 = self._safe_float(monthly[-1].get('avg_real_price'))
-                    pd_data['var_real_pct'] = round((r1 / r0 - 1) * 100, 2) if r0 and r0 > 0 and r1 is not None else None
-                else:
-                    pd_data['var_pct'] = None
-                    pd_data['var_real_pct'] = None
-                
-                safe_cid = ''.join(c if c.isalnum() or c in '-_' else '_' for c in cid)
-                (products_dir / f"{safe_cid}.json").write_text(
-                    json.dumps(pd_data, ensure_ascii=False), encoding='utf-8'
-                )
-        except Exception as _pd_err:
-            pass
+        self._write_product_details(out_dir / "products", payload, full_payload)
         tracker_css_path = out_dir / "tracker-ui.css"
 
         if offline_assets == "external":
             tracker_css_path.write_text(get_tracker_css_bundle(), encoding="utf-8")
         pdf_path = self._write_pdf_if_requested(html, out_dir / f"{base}.pdf") if export_pdf else None
 
-        payload_kb = len(json.dumps(payload, ensure_ascii=False).encode("utf-8")) / 1024.0
+        payload_kb = len(payload_json.encode("utf-8")) / 1024.0
         generation_ms = (perf_counter() - started) * 1000.0
         quality_flags = payload.get("quality_flags", {})
         scrape_quality = payload.get("scrape_quality", {})
@@ -2152,7 +2189,9 @@ class ReportGenerator:
             },
         }
         metadata_path = out_dir / f"{base}.metadata.json"
-        metadata_path.write_text(json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8")
+        analysis_cfg = self.config.get("analysis", {}) if isinstance(self.config.get("analysis"), dict) else {}
+        metadata_indent = 2 if bool(analysis_cfg.get("pretty_metadata", False)) else None
+        metadata_path.write_bytes(json.dumps(metadata, ensure_ascii=False, indent=metadata_indent).encode("utf-8"))
 
         return {
             "from_month": effective_from,
@@ -2,13 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime, time
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import product
 from math import ceil
-from typing import Any, Dict, List, Optional, Tuple
+from time import monotonic
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+import numpy as np
+from loguru import logger
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    and_,
+    bindparam,
+    case,
+    cast,
+    event,
+    exists,
+    func,
+    literal,
+    null,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    union,
+    union_all,
+)
+from sqlalchemy.orm import Session, object_session
 
 from src.models import (
     CategoryIndex,
@@ -23,35 +50,291 @@ from src.models import (
     TrackerIPCMonthly,
 )
 
+REPORT_STREAM_CHUNK_SIZE = 1000
+COUNT_MODES = ("exact", "estimate", "none")
+TRACKER_METHOD_CACHE_TTL_SECONDS = 30.0
+_TRACKER_METHOD_CACHE_KEY = "series_repository.latest_tracker_method"
+_IPC_RESULT_CACHE_KEY = "series_repository.ipc_results"
+_CATEGORY_EXISTS_CACHE_KEY = "series_repository.category_exists"
+
+_PUBLICATION_COLUMNS = (
+    IPCPublicationRun.run_uuid,
+    IPCPublicationRun.status,
+    IPCPublicationRun.basket_type,
+    IPCPublicationRun.region,
+    IPCPublicationRun.method_version,
+    IPCPublicationRun.from_month,
+    IPCPublicationRun.to_month,
+    IPCPublicationRun.official_source,
+    IPCPublicationRun.official_rows,
+    IPCPublicationRun.tracker_rows,
+    IPCPublicationRun.tracker_category_rows,
+    IPCPublicationRun.overlap_months,
+    IPCPublicationRun.warnings_json,
+    IPCPublicationRun.metrics_json,
+    IPCPublicationRun.started_at,
+    IPCPublicationRun.completed_at,
+)
+
+# Hot single-row lookups are built once at import time and parameterized with
+# bindparam, so each call only binds values and reuses the compiled SQL.
+_STMT_LATEST_METHOD_ALL = (
+    select(TrackerIPCMonthly.method_version).order_by(TrackerIPCMonthly.computed_at.desc()).limit(1)
+)
+_STMT_LATEST_METHOD_BY_BASKET = _STMT_LATEST_METHOD_ALL.where(
+    TrackerIPCMonthly.basket_type == bindparam("basket_type")
+)
+_STMT_CATEGORY_EXISTS = select(
+    exists()
+    .where(Product.category == bindparam("category"))
+)
+
+
+def _latest_publication_stmt(columns, by_basket: bool):
+    stmt = (
+        select(*columns)
+        .where(IPCPublicationRun.region == bindparam("region"))
+        .order_by(IPCPublicationRun.started_at.desc())
+        .limit(1)
+    )
+    if by_basket:
+        stmt = stmt.where(IPCPublicationRun.basket_type == bindparam("basket_type"))
+    return stmt
+
+
+# Keyed by filter_by_basket.
+_STMT_LATEST_PUBLICATION = {
+    by_basket: _latest_publication_stmt(_PUBLICATION_COLUMNS, by_basket)
+    for by_basket in (False, True)
+}
+# Source metadata only: skips warnings_json and the run counters.
+_STMT_LATEST_PUBLICATION_SOURCE = {
+    by_basket: _latest_publication_stmt(
+        (IPCPublicationRun.official_source, IPCPublicationRun.metrics_json),
+        by_basket,
+    )
+    for by_basket in (False, True)
+}
+
+# Official metric codes that never identify an INDEC division.
+NON_DIVISION_METRIC_CODES = ("general", "", "None")
+
+
+def _mapped_category_filters():
+    """Tracker category rows with a slug and a usable INDEC division code."""
+    return (
+        TrackerIPCCategoryMonthly.category_slug.isnot(None),
+        TrackerIPCCategoryMonthly.category_slug != "",
+        TrackerIPCCategoryMonthly.indec_division_code.isnot(None),
+        func.lower(func.trim(TrackerIPCCategoryMonthly.indec_division_code)).notin_(("", "none", "nan")),
+    )
+
+
+# Price series listings start from these module-level selects; filters are
+# appended as bindparam placeholders, so every filter combination compiles to
+# one cached statement and calls only bind values.
+_PRODUCT_SERIES_COLUMNS = {
+    "canonical_id": Price.canonical_id,
+    "product_name": Price.product_name,
+    "basket_id": Price.basket_id,
+    "current_price": Price.current_price,
+    "original_price": Price.original_price,
+    "price_per_unit": Price.price_per_unit,
+    "in_stock": Price.in_stock,
+    "is_promotion": Price.is_promotion,
+    "scraped_at": Price.scraped_at,
+    "run_uuid": ScrapeRun.run_uuid,
+    "run_started_at": ScrapeRun.started_at.label("run_started_at"),
+}
+_SCRAPE_RUN_COLUMNS = frozenset({"run_uuid", "run_started_at"})
+
+
+@lru_cache(maxsize=None)
+def _product_series_stmt(columns: Tuple[str, ...]):
+    """Price series select projecting only ``columns``; scrape_runs is joined only when needed."""
+    unknown = [name for name in columns if name not in _PRODUCT_SERIES_COLUMNS]
+    if unknown or not columns:
+        raise ValueError(f"Unknown product series columns: {unknown or columns}")
+    stmt = select(*(_PRODUCT_SERIES_COLUMNS[name] for name in columns)).select_from(Price)
+    if _SCRAPE_RUN_COLUMNS.intersection(columns):
+        stmt = stmt.join(ScrapeRun, Price.run_id == ScrapeRun.id)
+    return stmt
+
+
+_PRODUCT_SERIES_STMT = _product_series_stmt(tuple(_PRODUCT_SERIES_COLUMNS))
+_CATEGORY_SERIES_STMT = (
+    select(
+        Price.canonical_id,
+        Price.product_name,
+        Product.category,
+        Price.current_price,
+        Price.original_price,
+        Price.price_per_unit,
+        Price.in_stock,
+        Price.is_promotion,
+        Price.scraped_at,
+        ScrapeRun.run_uuid,
+    )
+    .join(ScrapeRun, Price.run_id == ScrapeRun.id)
+    .outerjoin(Product, Price.canonical_id == Product.canonical_id)
+    .where(Product.category == bindparam("category"))
+)
+
+_QUALITY_AUDIT_COLUMNS = (
+    IndexQualityAudit.coverage_rate,
+    IndexQualityAudit.outlier_count,
+    IndexQualityAudit.missing_count,
+    IndexQualityAudit.min_coverage_required,
+    IndexQualityAudit.is_coverage_sufficient,
+)
+
+_SERIES_FILTER_NAMES = ("canonical_id", "basket_id", "start_dt", "end_exclusive_dt")
+_SERIES_FILTER_CLAUSES = (
+    Price.canonical_id == bindparam("canonical_id"),
+    Price.basket_id == bindparam("basket_id"),
+    Price.scraped_at >= bindparam("start_dt", type_=DateTime()),
+    Price.scraped_at < bindparam("end_exclusive_dt", type_=DateTime()),
+)
+
+
+@lru_cache(maxsize=128)
+def _filtered_series_stmt(base, mask: Tuple[bool, ...]):
+    """``base`` with the series filters flagged in ``mask`` (one per ``_SERIES_FILTER_NAMES``)."""
+    clauses = [clause for clause, active in zip(_SERIES_FILTER_CLAUSES, mask) if active]
+    return base.where(*clauses) if clauses else base
+
+
+# Build every filter combination of the two listing statements up front so a
+# call only looks its shape up; per-call work is binding values.
+for _mask in product((False, True), repeat=len(_SERIES_FILTER_NAMES)):
+    _filtered_series_stmt(_PRODUCT_SERIES_STMT, _mask)
+    _filtered_series_stmt(_CATEGORY_SERIES_STMT, _mask)
+del _mask
+
+# Unique keyset orderings; the primary key breaks ties between equal rows.
+_PRICE_SERIES_KEYSET = (Price.scraped_at, Price.canonical_id, Price.id)
+_CATEGORY_INDEX_KEYSET = (CategoryIndex.year_month, CategoryIndex.category, CategoryIndex.id)
+
+
+@event.listens_for(Product, "after_insert")
+@event.listens_for(Product, "after_update")
+@event.listens_for(Product, "after_delete")
+def _forget_category_lookups(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.pop(_CATEGORY_EXISTS_CACHE_KEY, None)
+
+
+def _encode_cursor(values) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
 
-@dataclass
+def _decode_cursor(cursor: str, order_cols) -> Tuple[Any, ...]:
+    """Decode an opaque keyset cursor; raises ``ValueError`` when it is malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (UnicodeError, binascii.Error, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    if not isinstance(values, list) or len(values) != len(order_cols):
+        raise ValueError("Invalid pagination cursor")
+    decoded = []
+    for col, value in zip(order_cols, values):
+        if isinstance(col.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Invalid pagination cursor") from exc
+        elif isinstance(value, bool) or not isinstance(value, col.type.python_type):
+            # Anything else would reach the row comparison unchecked (and fail
+            # in the driver), so each value must match its column's type.
+            raise ValueError("Invalid pagination cursor")
+        decoded.append(value)
+    return tuple(decoded)
+
+
+def _day_start(value: Optional[date], days_after: int = 0) -> Optional[datetime]:
+    """Midnight of ``value`` (plus ``days_after`` days) as a naive datetime."""
+    if not value:
+        return None
+    day = value + timedelta(days=days_after)
+    return datetime(day.year, day.month, day.day)
+
+
+def _year_month(value: str) -> str:
+    """Validate a ``YYYY-MM`` bound so string comparison matches month order."""
+    if len(value) != 7 or value[4] != "-" or not (value[:4] + value[5:]).isdigit():
+        raise ValueError(f"Invalid period {value!r}; expected YYYY-MM")
+    return value
+
+
+def _rows_to_dicts(rows, keys: Optional[Tuple[str, ...]] = None) -> List[Dict[str, Any]]:
+    """Turn result rows into dicts, resolving column names once per result."""
+    if not rows:
+        return []
+    if keys is None:
+        keys = rows[0]._fields
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def _float_array(values: Iterable[Any]) -> np.ndarray:
+    """Build a float64 array from nullable numeric values, mapping ``None`` to NaN."""
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass(frozen=True, slots=True)
 class Pagination:
-    """Pagination metadata."""
+    """Pagination metadata.
+
+    Keyset (cursor) pages have no page number or total: ``page``, ``total``
+    and ``total_pages`` are None and ``has_more``/``next_cursor`` drive paging.
+    """
 
-    page: int
+    page: Optional[int]
     page_size: int
-    total: int
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+    has_more: Optional[bool] = None
+    total_pages: Optional[int] = field(init=False, default=None)
 
-    @property
-    def total_pages(self) -> int:
-        if self.total == 0:
-            return 0
-        return ceil(self.total / self.page_size)
+    def __post_init__(self) -> None:
+        if self.total is not None:
+            total_pages = ceil(self.total / self.page_size) if self.total else 0
+            object.__setattr__(self, "total_pages", total_pages)
 
-    def as_dict(self) -> Dict[str, int]:
-        return {
+    def as_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
             "page": self.page,
             "page_size": self.page_size,
             "total": self.total,
             "total_pages": self.total_pages,
         }
+        if self.has_more is not None:
+            data["next_cursor"] = self.next_cursor
+            data["has_more"] = self.has_more
+        return data
 
 
 class SeriesRepository:
     """Reusable SQLAlchemy queries used by API and exporters."""
 
-    def __init__(self, session: Session):
+    _ipc_cache_generation = 0
+
+    def __init__(self, session: Session, count_mode: str = "exact"):
+        """``count_mode`` sets how paginated totals are computed.
+
+        ``"exact"`` counts every match, ``"estimate"`` uses the PostgreSQL
+        planner estimate (exact elsewhere) and ``"none"`` skips totals.
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"count_mode must be one of {COUNT_MODES}, got {count_mode!r}")
         self.session = session
+        self.count_mode = count_mode
+        self._category_map: Optional[Dict[str, str]] = None
 
     def get_product_series(
         self,
@@ -61,18 +344,28 @@ class SeriesRepository:
         end_date: Optional[date] = None,
         page: int = 1,
         page_size: int = 100,
+        count: bool = True,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
-        query = self._base_product_series_query()
-        query = self._apply_series_filters(
-            query,
+        """Return one page of price observations.
+
+        Passing ``cursor`` (``""`` for the first page, then the previous
+        ``next_cursor``) switches from OFFSET pagination to a keyset seek.
+        """
+        stmt, params = self._apply_series_filters(
+            _PRODUCT_SERIES_STMT,
             canonical_id=canonical_id,
             basket_type=basket_type,
-            start_date=start_date,
-            end_date=end_date,
+            start_dt=_day_start(start_date),
+            end_exclusive_dt=_day_start(end_date, days_after=1),
         )
-        query = query.order_by(Price.scraped_at.asc(), Price.canonical_id.asc())
+        if cursor is not None:
+            return self._paginate_keyset(
+                stmt, _PRICE_SERIES_KEYSET, cursor=cursor, page_size=page_size, params=params
+            )
+        stmt = stmt.order_by(Price.scraped_at.asc(), Price.canonical_id.asc())
 
-        return self._paginate_query(query, page=page, page_size=page_size)
+        return self._paginate_query(stmt, page=page, page_size=page_size, params=params, count=count)
 
     def get_all_product_series(
         self,
@@ -80,17 +373,42 @@ class SeriesRepository:
         basket_type: str = "all",
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        query = self._base_product_series_query()
-        query = self._apply_series_filters(
-            query,
+        return list(
+            self.iter_all_product_series(
+                canonical_id=canonical_id,
+                basket_type=basket_type,
+                start_date=start_date,
+                end_date=end_date,
+                columns=columns,
+            )
+        )
+
+    def iter_all_product_series(
+        self,
+        canonical_id: Optional[str] = None,
+        basket_type: str = "all",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        chunk_size: int = REPORT_STREAM_CHUNK_SIZE,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every matching price observation, ordered by product and time.
+
+        ``columns`` restricts the projection to those output keys (default:
+        all of them); run metadata is only joined in when requested.
+        """
+        base = _product_series_stmt(tuple(columns)) if columns else _PRODUCT_SERIES_STMT
+        stmt, params = self._apply_series_filters(
+            base,
             canonical_id=canonical_id,
             basket_type=basket_type,
-            start_date=start_date,
-            end_date=end_date,
+            start_dt=_day_start(start_date),
+            end_exclusive_dt=_day_start(end_date, days_after=1),
         )
-        rows = query.order_by(Price.canonical_id.asc(), Price.scraped_at.asc()).all()
-        return [dict(row._mapping) for row in rows]
+        stmt = stmt.order_by(Price.canonical_id.asc(), Price.scraped_at.asc())
+        return self._stream_dicts(stmt, params, chunk_size)
 
     def get_report_rows(
         self,
@@ -99,8 +417,88 @@ class SeriesRepository:
         end_exclusive_dt: datetime,
     ) -> List[Dict[str, Any]]:
         """Return raw rows needed by interactive HTML report."""
-        query = (
-            self.session.query(
+        return list(self.iter_report_rows(basket_type, start_dt, end_exclusive_dt))
+
+    def iter_report_rows(
+        self,
+        basket_type: str,
+        start_dt: datetime,
+        end_exclusive_dt: datetime,
+        chunk_size: int = REPORT_STREAM_CHUNK_SIZE,
+        granularity: str = "raw",
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield report rows lazily, fetching ``chunk_size`` rows at a time.
+
+        Uses a server-side cursor where the driver supports one, so memory
+        stays bounded by one chunk instead of the whole report range. With
+        ``granularity="day"`` only the last observation per product, basket
+        and day is returned, rolled up in SQL.
+        """
+        # Empty ranges stop at one EXISTS probe, before the ordered report
+        # query runs or the category map is loaded.
+        if not self.has_report_data(basket_type, start_dt, end_exclusive_dt):
+            return
+        stmt = self._report_query(basket_type, start_dt, end_exclusive_dt, granularity)
+        # Category comes from a per-repository lookup map rather than a
+        # products join, so the scraped_at range scan drives the plan alone.
+        category_map = self._load_category_map()
+        for item in self._stream_dicts(stmt, {}, chunk_size):
+            item["category"] = category_map.get(item["canonical_id"])
+            yield item
+
+    def has_report_data(self, basket_type: str, start_dt: datetime, end_exclusive_dt: datetime) -> bool:
+        """Cheap EXISTS probe: is there any price observation in the report range?"""
+        return self._range_has_rows(Price, basket_type, start_dt, end_exclusive_dt)
+
+    def _range_has_rows(self, model, basket_type: str, start_dt: datetime, end_exclusive_dt: datetime) -> bool:
+        # Served by the (basket_id, scraped_at, ...) / scraped_at indexes and
+        # stops at the first matching row.
+        condition = exists().where(model.scraped_at >= start_dt).where(model.scraped_at < end_exclusive_dt)
+        if basket_type != "all":
+            condition = condition.where(model.basket_id == basket_type)
+        return bool(self.session.execute(select(condition)).scalar())
+
+    def get_report_columns(
+        self,
+        basket_type: str,
+        start_dt: datetime,
+        end_exclusive_dt: datetime,
+        chunk_size: int = REPORT_STREAM_CHUNK_SIZE,
+        granularity: str = "raw",
+    ) -> Dict[str, List[Any]]:
+        """Return the report rows of ``iter_report_rows`` as ``{column: values}``.
+
+        Each fetched chunk is transposed straight into per-column lists, so
+        no per-row dict is built; the result feeds ``pd.DataFrame`` directly.
+        """
+        stmt = self._report_query(basket_type, start_dt, end_exclusive_dt, granularity)
+        result = self.session.execute(stmt.execution_options(yield_per=chunk_size))
+        names = list(result.keys())
+        columns: Dict[str, List[Any]] = {name: [] for name in names}
+        for partition in result.partitions():
+            for name, values in zip(names, zip(*partition)):
+                columns[name].extend(values)
+        category_map = self._load_category_map()
+        columns["category"] = [category_map.get(canonical_id) for canonical_id in columns["canonical_id"]]
+        return columns
+
+    def _report_query(self, basket_type: str, start_dt: datetime, end_exclusive_dt: datetime, granularity: str):
+        if granularity == "day":
+            return self._report_daily_rollup_query(basket_type, start_dt, end_exclusive_dt)
+        return self._report_rows_query(basket_type, start_dt, end_exclusive_dt)
+
+    def _load_category_map(self) -> Dict[str, str]:
+        """Return ``{canonical_id: category}``, loaded once per repository."""
+        if self._category_map is None:
+            rows = self.session.execute(
+                select(Product.canonical_id, Product.category).where(Product.category.isnot(None))
+            ).all()
+            self._category_map = dict(rows)
+        return self._category_map
+
+    def _report_rows_base_query(self, basket_type: str, start_dt: datetime, end_exclusive_dt: datetime):
+        stmt = (
+            select(
                 Price.canonical_id,
                 Price.product_name,
                 Price.basket_id,
@@ -108,17 +506,45 @@ class SeriesRepository:
                 Price.scraped_at,
                 Price.product_url,
                 Price.product_size,
-                Product.category,
             )
-            .outerjoin(Product, Price.canonical_id == Product.canonical_id)
-            .filter(Price.scraped_at >= start_dt)
-            .filter(Price.scraped_at < end_exclusive_dt)
+            .where(Price.scraped_at >= start_dt)
+            .where(Price.scraped_at < end_exclusive_dt)
         )
         if basket_type != "all":
-            query = query.filter(Price.basket_id == basket_type)
+            stmt = stmt.where(Price.basket_id == basket_type)
+        return stmt
+
+    def _report_rows_query(self, basket_type: str, start_dt: datetime, end_exclusive_dt: datetime):
+        stmt = self._report_rows_base_query(basket_type, start_dt, end_exclusive_dt)
+        return stmt.order_by(Price.canonical_id.asc(), Price.scraped_at.asc())
 
-        rows = query.order_by(Price.canonical_id.asc(), Price.scraped_at.asc()).all()
-        return [dict(row._mapping) for row in rows]
+    def _report_daily_rollup_query(self, basket_type: str, start_dt: datetime, end_exclusive_dt: datetime):
+        """Report rows reduced in SQL to the last observation per product/basket/day."""
+        ranked = (
+            self._report_rows_base_query(basket_type, start_dt, end_exclusive_dt)
+            .add_columns(
+                func.row_number()
+                .over(
+                    partition_by=(Price.canonical_id, Price.basket_id, func.date(Price.scraped_at)),
+                    order_by=(Price.scraped_at.desc(), Price.id.desc()),
+                )
+                .label("day_rank")
+            )
+            .subquery("ranked")
+        )
+        return (
+            select(
+                ranked.c.canonical_id,
+                ranked.c.product_name,
+                ranked.c.basket_id,
+                ranked.c.current_price,
+                ranked.c.scraped_at,
+                ranked.c.product_url,
+                ranked.c.product_size,
+            )
+            .where(ranked.c.day_rank == 1)
+            .order_by(ranked.c.canonical_id.asc(), ranked.c.scraped_at.asc())
+        )
 
     def get_candidate_rows(
         self,
@@ -127,8 +553,20 @@ class SeriesRepository:
         end_exclusive_dt: datetime,
     ) -> List[Dict[str, Any]]:
         """Return candidate low/mid/high rows for interactive report overlays."""
-        query = (
-            self.session.query(
+        return list(self.iter_candidate_rows(basket_type, start_dt, end_exclusive_dt))
+
+    def iter_candidate_rows(
+        self,
+        basket_type: str,
+        start_dt: datetime,
+        end_exclusive_dt: datetime,
+        chunk_size: int = REPORT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield candidate rows lazily (see ``get_candidate_rows``)."""
+        if not self._range_has_rows(PriceCandidate, basket_type, start_dt, end_exclusive_dt):
+            return iter(())
+        stmt = (
+            select(
                 PriceCandidate.run_id,
                 PriceCandidate.canonical_id,
                 PriceCandidate.basket_id,
@@ -144,14 +582,14 @@ class SeriesRepository:
                 PriceCandidate.is_fallback,
                 PriceCandidate.scraped_at,
             )
-            .filter(PriceCandidate.scraped_at >= start_dt)
-            .filter(PriceCandidate.scraped_at < end_exclusive_dt)
+            .where(PriceCandidate.scraped_at >= start_dt)
+            .where(PriceCandidate.scraped_at < end_exclusive_dt)
         )
         if basket_type != "all":
-            query = query.filter(PriceCandidate.basket_id == basket_type)
+            stmt = stmt.where(PriceCandidate.basket_id == basket_type)
 
-        rows = query.order_by(PriceCandidate.canonical_id.asc(), PriceCandidate.scraped_at.asc()).all()
-        return [dict(row._mapping) for row in rows]
+        stmt = stmt.order_by(PriceCandidate.canonical_id.asc(), PriceCandidate.scraped_at.asc())
+        return self._stream_dicts(stmt, {}, chunk_size)
 
     def get_category_series(
         self,
@@ -160,26 +598,23 @@ class SeriesRepository:
         end_date: Optional[date] = None,
         page: int = 1,
         page_size: int = 100,
+        count: bool = True,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
-        query = self.session.query(
-            Price.canonical_id,
-            Price.product_name,
-            Product.category,
-            Price.current_price,
-            Price.original_price,
-            Price.price_per_unit,
-            Price.in_stock,
-            Price.is_promotion,
-            Price.scraped_at,
-            ScrapeRun.run_uuid,
-        ).join(ScrapeRun, Price.run_id == ScrapeRun.id).outerjoin(
-            Product, Price.canonical_id == Product.canonical_id
-        ).filter(func.lower(Product.category) == category.lower())
-
-        query = self._apply_series_filters(query, start_date=start_date, end_date=end_date)
-        query = query.order_by(Price.scraped_at.asc(), Price.canonical_id.asc())
-
-        return self._paginate_query(query, page=page, page_size=page_size)
+        """Return one page of a category's price observations (see ``get_product_series``)."""
+        stmt, params = self._apply_series_filters(
+            _CATEGORY_SERIES_STMT,
+            start_dt=_day_start(start_date),
+            end_exclusive_dt=_day_start(end_date, days_after=1),
+        )
+        params["category"] = category.strip().lower()
+        if cursor is not None:
+            return self._paginate_keyset(
+                stmt, _PRICE_SERIES_KEYSET, cursor=cursor, page_size=page_size, params=params
+            )
+        stmt = stmt.order_by(Price.scraped_at.asc(), Price.canonical_id.asc())
+
+        return self._paginate_query(stmt, page=page, page_size=page_size, params=params, count=count)
 
     def get_ipc_categories(
         self,
@@ -187,8 +622,11 @@ class SeriesRepository:
         end_period: Optional[str] = None,
         page: int = 1,
         page_size: int = 100,
+        count: bool = True,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
-        query = self.session.query(
+        """Return category indices with quality audit fields (keyset paged when ``cursor`` is given)."""
+        stmt = select(
             CategoryIndex.category,
             CategoryIndex.basket_type,
             CategoryIndex.year_month,
@@ -198,34 +636,96 @@ class SeriesRepository:
             CategoryIndex.products_included,
             CategoryIndex.products_missing,
             CategoryIndex.computed_at,
-            IndexQualityAudit.coverage_rate,
-            IndexQualityAudit.outlier_count,
-            IndexQualityAudit.missing_count,
-            IndexQualityAudit.min_coverage_required,
-            IndexQualityAudit.is_coverage_sufficient,
-            (IndexQualityAudit.is_coverage_sufficient == False).label("coverage_warning"),
-        ).outerjoin(
-            IndexQualityAudit,
-            (IndexQualityAudit.basket_type == CategoryIndex.basket_type)
-            & (IndexQualityAudit.year_month == CategoryIndex.year_month)
-            & (IndexQualityAudit.category == CategoryIndex.category),
         )
 
         if start_period:
-            query = query.filter(CategoryIndex.year_month >= start_period)
+            stmt = stmt.where(CategoryIndex.year_month >= _year_month(start_period))
         if end_period:
-            query = query.filter(CategoryIndex.year_month <= end_period)
+            stmt = stmt.where(CategoryIndex.year_month <= _year_month(end_period))
 
-        query = query.order_by(CategoryIndex.year_month.asc(), CategoryIndex.category.asc())
+        if cursor is not None:
+            rows, pagination = self._paginate_keyset(
+                stmt, _CATEGORY_INDEX_KEYSET, cursor=cursor, page_size=page_size
+            )
+        else:
+            stmt = stmt.order_by(CategoryIndex.year_month.asc(), CategoryIndex.category.asc())
+            rows, pagination = self._paginate_query(stmt, page=page, page_size=page_size, count=count)
+        self._attach_quality_audits(rows)
+        return rows, pagination
 
-        return self._paginate_query(query, page=page, page_size=page_size)
+    def _attach_quality_audits(self, rows: List[Dict[str, Any]]) -> None:
+        """Merge audit fields into a page of category index rows.
+
+        The page is fetched first; its audits then come from one batched
+        composite-key IN lookup instead of an outer join over the whole range.
+        """
+        audits: Dict[Tuple[str, str, str], Any] = {}
+        if rows:
+            keys = {(row["basket_type"], row["year_month"], row["category"]) for row in rows}
+            audit_rows = self.session.execute(
+                select(
+                    IndexQualityAudit.basket_type,
+                    IndexQualityAudit.year_month,
+                    IndexQualityAudit.category,
+                    *_QUALITY_AUDIT_COLUMNS,
+                ).where(
+                    tuple_(
+                        IndexQualityAudit.basket_type,
+                        IndexQualityAudit.year_month,
+                        IndexQualityAudit.category,
+                    ).in_(sorted(keys))
+                )
+            ).all()
+            audits = {tuple(audit[:3]): audit for audit in audit_rows}
+        for row in rows:
+            audit = audits.get((row["basket_type"], row["year_month"], row["category"]))
+            for column in _QUALITY_AUDIT_COLUMNS:
+                row[column.key] = getattr(audit, column.key) if audit is not None else None
+            sufficient = row["is_coverage_sufficient"]
+            row["coverage_warning"] = None if sufficient is None else not sufficient
+
+    @classmethod
+    def invalidate_ipc_cache(cls) -> None:
+        """Expire memoized IPC lookups and results (call after IPC rows are written)."""
+        cls._ipc_cache_generation += 1
+
+    def _cached_ipc_result(self, loader, **kwargs: Any) -> Tuple[List[Dict[str, Any]], Pagination]:
+        """Return ``loader(**kwargs)`` memoized on the session for identical arguments.
+
+        IPC rows only change when a tracker build, official sync or publication
+        run commits, and those bump the class generation, which drops every
+        cached entry. Callers get fresh row dicts so they can mutate freely.
+        """
+        cache = self.session.info.get(_IPC_RESULT_CACHE_KEY)
+        if cache is None or cache["generation"] != self._ipc_cache_generation:
+            cache = {"generation": self._ipc_cache_generation, "results": {}}
+            self.session.info[_IPC_RESULT_CACHE_KEY] = cache
+        key = (loader.__name__, tuple(sorted(kwargs.items())))
+        if key not in cache["results"]:
+            cache["results"][key] = loader(**kwargs)
+        rows, pagination = cache["results"][key]
+        # Pagination is frozen, so the cached instance can be shared as-is.
+        return [dict(row) for row in rows], pagination
 
     def _latest_tracker_method(self, basket_type: str) -> Optional[str]:
-        query = self.session.query(TrackerIPCMonthly.method_version)
+        # Memoized per session so repeated series/comparison calls skip the
+        # ORDER BY ... LIMIT 1 lookup; entries expire after a short TTL or
+        # when a publication run bumps the class generation.
+        cache = self.session.info.setdefault(_TRACKER_METHOD_CACHE_KEY, {})
+        now = monotonic()
+        cached = cache.get(basket_type)
+        if cached is not None:
+            generation, expires_at, method = cached
+            if generation == self._ipc_cache_generation and now < expires_at:
+                return method
+
         if basket_type != "all":
-            query = query.filter(TrackerIPCMonthly.basket_type == basket_type)
-        row = query.order_by(TrackerIPCMonthly.computed_at.desc()).first()
-        return str(row[0]) if row and row[0] else None
+            value = self.session.execute(_STMT_LATEST_METHOD_BY_BASKET, {"basket_type": basket_type}).scalar()
+        else:
+            value = self.session.execute(_STMT_LATEST_METHOD_ALL).scalar()
+        method = str(value) if value else None
+        cache[basket_type] = (self._ipc_cache_generation, now + TRACKER_METHOD_CACHE_TTL_SECONDS, method)
+        return method
 
     def get_tracker_ipc_general(
         self,
@@ -236,9 +736,33 @@ class SeriesRepository:
         status: Optional[str] = None,
         page: int = 1,
         page_size: int = 100,
+        count: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Pagination]:
+        return self._cached_ipc_result(
+            self._load_tracker_ipc_general,
+            basket_type=basket_type,
+            start_period=start_period,
+            end_period=end_period,
+            method_version=method_version,
+            status=status,
+            page=page,
+            page_size=page_size,
+            count=count,
+        )
+
+    def _load_tracker_ipc_general(
+        self,
+        basket_type: str = "all",
+        start_period: Optional[str] = None,
+        end_period: Optional[str] = None,
+        method_version: Optional[str] = None,
+        status: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 100,
+        count: bool = True,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
         method = method_version or self._latest_tracker_method(basket_type) or None
-        query = self.session.query(
+        stmt = select(
             TrackerIPCMonthly.basket_type,
             TrackerIPCMonthly.year_month,
             TrackerIPCMonthly.method_version,
@@ -258,18 +782,18 @@ class SeriesRepository:
             TrackerIPCMonthly.frozen_at,
         )
         if basket_type != "all":
-            query = query.filter(TrackerIPCMonthly.basket_type == basket_type)
+            stmt = stmt.where(TrackerIPCMonthly.basket_type == basket_type)
         if method:
-            query = query.filter(TrackerIPCMonthly.method_version == method)
+            stmt = stmt.where(TrackerIPCMonthly.method_version == method)
         if status:
-            query = query.filter(TrackerIPCMonthly.status == status)
+            stmt = stmt.where(TrackerIPCMonthly.status == status)
         if start_period:
-            query = query.filter(TrackerIPCMonthly.year_month >= start_period)
+            stmt = stmt.where(TrackerIPCMonthly.year_month >= start_period)
         if end_period:
-            query = query.filter(TrackerIPCMonthly.year_month <= end_period)
+            stmt = stmt.where(TrackerIPCMonthly.year_month <= end_period)
 
-        query = query.order_by(TrackerIPCMonthly.year_month.asc(), TrackerIPCMonthly.basket_type.asc())
-        return self._paginate_query(query, page=page, page_size=page_size)
+        stmt = stmt.order_by(TrackerIPCMonthly.year_month.asc(), TrackerIPCMonthly.basket_type.asc())
+        return self._paginate_query(stmt, page=page, page_size=page_size, count=count)
 
     def get_tracker_ipc_categories(
         self,
@@ -281,9 +805,38 @@ class SeriesRepository:
         status: Optional[str] = None,
         page: int = 1,
         page_size: int = 100,
+        count: bool = True,
+        require_division: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Pagination]:
+        return self._cached_ipc_result(
+            self._load_tracker_ipc_categories,
+            basket_type=basket_type,
+            category_slug=category_slug,
+            start_period=start_period,
+            end_period=end_period,
+            method_version=method_version,
+            status=status,
+            page=page,
+            page_size=page_size,
+            count=count,
+            require_division=require_division,
+        )
+
+    def _load_tracker_ipc_categories(
+        self,
+        basket_type: str = "all",
+        category_slug: Optional[str] = None,
+        start_period: Optional[str] = None,
+        end_period: Optional[str] = None,
+        method_version: Optional[str] = None,
+        status: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 100,
+        count: bool = True,
+        require_division: bool = False,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
         method = method_version or self._latest_tracker_method(basket_type) or None
-        query = self.session.query(
+        stmt = select(
             TrackerIPCCategoryMonthly.basket_type,
             TrackerIPCCategoryMonthly.category_slug,
             TrackerIPCCategoryMonthly.indec_division_code,
@@ -305,20 +858,22 @@ class SeriesRepository:
             TrackerIPCCategoryMonthly.frozen_at,
         )
         if basket_type != "all":
-            query = query.filter(TrackerIPCCategoryMonthly.basket_type == basket_type)
+            stmt = stmt.where(TrackerIPCCategoryMonthly.basket_type == basket_type)
         if category_slug:
-            query = query.filter(TrackerIPCCategoryMonthly.category_slug == category_slug)
+            stmt = stmt.where(TrackerIPCCategoryMonthly.category_slug == category_slug)
         if method:
-            query = query.filter(TrackerIPCCategoryMonthly.method_version == method)
+            stmt = stmt.where(TrackerIPCCategoryMonthly.method_version == method)
         if status:
-            query = query.filter(TrackerIPCCategoryMonthly.status == status)
+            stmt = stmt.where(TrackerIPCCategoryMonthly.status == status)
+        if require_division:
+            stmt = stmt.where(*_mapped_category_filters())
         if start_period:
-            query = query.filter(TrackerIPCCategoryMonthly.year_month >= start_period)
+            stmt = stmt.where(TrackerIPCCategoryMonthly.year_month >= start_period)
         if end_period:
-            query = query.filter(TrackerIPCCategoryMonthly.year_month <= end_period)
+            stmt = stmt.where(TrackerIPCCategoryMonthly.year_month <= end_period)
 
-        query = query.order_by(TrackerIPCCategoryMonthly.category_slug.asc(), TrackerIPCCategoryMonthly.year_month.asc())
-        return self._paginate_query(query, page=page, page_size=page_size)
+        stmt = stmt.order_by(TrackerIPCCategoryMonthly.category_slug.asc(), TrackerIPCCategoryMonthly.year_month.asc())
+        return self._paginate_query(stmt, page=page, page_size=page_size, count=count)
 
     def get_official_ipc_patagonia(
         self,
@@ -330,8 +885,37 @@ class SeriesRepository:
         source: Optional[str] = None,
         page: int = 1,
         page_size: int = 100,
+        count: bool = True,
+        exclude_metric_codes: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Pagination]:
+        return self._cached_ipc_result(
+            self._load_official_ipc_patagonia,
+            start_period=start_period,
+            end_period=end_period,
+            metric_code=metric_code,
+            category_slug=category_slug,
+            region=region,
+            source=source,
+            page=page,
+            page_size=page_size,
+            count=count,
+            exclude_metric_codes=exclude_metric_codes,
+        )
+
+    def _load_official_ipc_patagonia(
+        self,
+        start_period: Optional[str] = None,
+        end_period: Optional[str] = None,
+        metric_code: Optional[str] = "general",
+        category_slug: Optional[str] = None,
+        region: str = "patagonia",
+        source: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 100,
+        count: bool = True,
+        exclude_metric_codes: Optional[Tuple[str, ...]] = None,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
-        query = self.session.query(
+        stmt = select(
             OfficialCPIMonthly.source,
             OfficialCPIMonthly.region,
             OfficialCPIMonthly.metric_code,
@@ -344,21 +928,23 @@ class SeriesRepository:
             OfficialCPIMonthly.is_fallback,
             OfficialCPIMonthly.raw_snapshot_path,
             OfficialCPIMonthly.updated_at,
-        ).filter(OfficialCPIMonthly.region == region)
+        ).where(OfficialCPIMonthly.region == region)
 
         if source:
-            query = query.filter(OfficialCPIMonthly.source == source)
+            stmt = stmt.where(OfficialCPIMonthly.source == source)
         if metric_code:
-            query = query.filter(OfficialCPIMonthly.metric_code == metric_code)
+            stmt = stmt.where(OfficialCPIMonthly.metric_code == metric_code)
+        if exclude_metric_codes:
+            stmt = stmt.where(OfficialCPIMonthly.metric_code.notin_(exclude_metric_codes))
         if category_slug:
-            query = query.filter(OfficialCPIMonthly.category_slug == category_slug)
+            stmt = stmt.where(OfficialCPIMonthly.category_slug == category_slug)
         if start_period:
-            query = query.filter(OfficialCPIMonthly.year_month >= start_period)
+            stmt = stmt.where(OfficialCPIMonthly.year_month >= start_period)
         if end_period:
-            query = query.filter(OfficialCPIMonthly.year_month <= end_period)
+            stmt = stmt.where(OfficialCPIMonthly.year_month <= end_period)
 
-        query = query.order_by(OfficialCPIMonthly.year_month.asc(), OfficialCPIMonthly.metric_code.asc())
-        return self._paginate_query(query, page=page, page_size=page_size)
+        stmt = stmt.order_by(OfficialCPIMonthly.year_month.asc(), OfficialCPIMonthly.metric_code.asc())
+        return self._paginate_query(stmt, page=page, page_size=page_size, count=count)
 
     def get_ipc_comparison_general(
         self,
@@ -371,84 +957,83 @@ class SeriesRepository:
         page: int = 1,
         page_size: int = 100,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
-        tracker_rows, _ = self.get_tracker_ipc_general(
-            basket_type=basket_type,
-            start_period=start_period,
-            end_period=end_period,
-            method_version=method_version,
-            page=1,
-            page_size=2000,
-        )
-        official_rows, _ = self.get_official_ipc_patagonia(
-            start_period=start_period,
-            end_period=end_period,
-            metric_code="general",
-            region=region,
-            source=source,
-            page=1,
-            page_size=2000,
-        )
-        tracker_by_month = {str(r["year_month"]): r for r in tracker_rows}
-        official_by_month = {str(r["year_month"]): r for r in official_rows}
-        months = sorted(set(tracker_by_month.keys()) | set(official_by_month.keys()))
-
-        overlap = [
-            m for m in months
-            if tracker_by_month.get(m, {}).get("index_value") is not None
-            and official_by_month.get(m, {}).get("index_value") is not None
-        ]
-        tracker_base = float(tracker_by_month[overlap[0]]["index_value"]) if overlap else None
-        official_base = float(official_by_month[overlap[0]]["index_value"]) if overlap else None
+        """Compare tracker vs official general CPI rebased to the first overlap month.
 
-        rows: List[Dict[str, Any]] = []
-        for month in months:
-            tracker = tracker_by_month.get(month, {})
-            official = official_by_month.get(month, {})
-            tracker_idx = tracker.get("index_value")
-            official_idx = official.get("index_value")
-            tracker_base100 = None
-            official_base100 = None
-            if tracker_idx is not None and tracker_base and tracker_base != 0:
-                tracker_base100 = (float(tracker_idx) / tracker_base) * 100.0
-            if official_idx is not None and official_base and official_base != 0:
-                official_base100 = (float(official_idx) / official_base) * 100.0
-
-            gap_index = (
-                tracker_base100 - official_base100
-                if tracker_base100 is not None and official_base100 is not None
-                else None
+        Months, base-100 rebasing, gaps and overlap flags are all computed in
+        a single SQL statement and paginated in the database.
+        """
+        # When several baskets/sources share a month, keep one row per month
+        # (highest basket_type, latest official row) like the former dict merge.
+        tracker = (
+            self._comparison_tracker_query(
+                TrackerIPCMonthly,
+                basket_type=basket_type,
+                start_period=start_period,
+                end_period=end_period,
+                method_version=method_version,
             )
-            tracker_mom = tracker.get("mom_change")
-            official_mom = official.get("mom_change")
-            gap_mom = (
-                float(tracker_mom) - float(official_mom)
-                if tracker_mom is not None and official_mom is not None
-                else None
+            .add_columns(
+                func.row_number()
+                .over(
+                    partition_by=TrackerIPCMonthly.year_month,
+                    order_by=(TrackerIPCMonthly.basket_type.desc(), TrackerIPCMonthly.id.desc()),
+                )
+                .label("row_rank")
             )
-            rows.append(
-                {
-                    "year_month": month,
-                    "basket_type": basket_type,
-                    "method_version": tracker.get("method_version"),
-                    "region": region,
-                    "tracker_index": tracker_idx,
-                    "official_index": official_idx,
-                    "tracker_mom": tracker_mom,
-                    "official_mom": official_mom,
-                    "tracker_status": tracker.get("status"),
-                    "official_status": official.get("status"),
-                    "tracker_index_base100": tracker_base100,
-                    "official_index_base100": official_base100,
-                    "gap_index_points": gap_index,
-                    "gap_mom_pp": gap_mom,
-                    "is_overlap": month in overlap,
-                }
+            .subquery("tracker")
+        )
+        official = (
+            self._comparison_official_query(
+                start_period=start_period,
+                end_period=end_period,
+                metric_code="general",
+                region=region,
+                source=source,
+            )
+            .add_columns(
+                func.row_number()
+                .over(partition_by=OfficialCPIMonthly.year_month, order_by=OfficialCPIMonthly.id.desc())
+                .label("row_rank")
             )
+            .subquery("official")
+        )
+        months = union(select(tracker.c.year_month), select(official.c.year_month)).subquery("months")
 
-        total = len(rows)
-        start = (page - 1) * page_size
-        paged = rows[start:start + page_size]
-        return paged, Pagination(page=page, page_size=page_size, total=total)
+        both_present = and_(tracker.c.index_value.isnot(None), official.c.index_value.isnot(None))
+        overlap_first = (case((both_present, 0), else_=1), months.c.year_month)
+        tracker_base = func.first_value(case((both_present, cast(tracker.c.index_value, Float)))).over(
+            order_by=overlap_first
+        )
+        official_base = func.first_value(case((both_present, cast(official.c.index_value, Float)))).over(
+            order_by=overlap_first
+        )
+        tracker_base100 = cast(tracker.c.index_value, Float) * 100.0 / func.nullif(tracker_base, 0)
+        official_base100 = cast(official.c.index_value, Float) * 100.0 / func.nullif(official_base, 0)
+
+        stmt = (
+            select(
+                months.c.year_month,
+                literal(basket_type).label("basket_type"),
+                tracker.c.method_version,
+                literal(region).label("region"),
+                tracker.c.index_value.label("tracker_index"),
+                official.c.index_value.label("official_index"),
+                tracker.c.mom_change.label("tracker_mom"),
+                official.c.mom_change.label("official_mom"),
+                tracker.c.status.label("tracker_status"),
+                official.c.status.label("official_status"),
+                tracker_base100.label("tracker_index_base100"),
+                official_base100.label("official_index_base100"),
+                (tracker_base100 - official_base100).label("gap_index_points"),
+                (cast(tracker.c.mom_change, Float) - cast(official.c.mom_change, Float)).label("gap_mom_pp"),
+                type_coerce(case((both_present, True), else_=False), Boolean).label("is_overlap"),
+            )
+            .select_from(months)
+            .outerjoin(tracker, and_(tracker.c.year_month == months.c.year_month, tracker.c.row_rank == 1))
+            .outerjoin(official, and_(official.c.year_month == months.c.year_month, official.c.row_rank == 1))
+            .order_by(months.c.year_month.asc())
+        )
+        return self._paginate_query(stmt, page=page, page_size=page_size)
 
     def get_ipc_comparison_categories(
         self,
@@ -462,197 +1047,392 @@ class SeriesRepository:
         page: int = 1,
         page_size: int = 100,
     ) -> Tuple[List[Dict[str, Any]], Pagination]:
-        tracker_rows, _ = self.get_tracker_ipc_categories(
-            basket_type=basket_type,
-            category_slug=category_slug,
-            start_period=start_period,
-            end_period=end_period,
-            method_version=method_version,
-            page=1,
-            page_size=5000,
+        tracker = (
+            self._comparison_tracker_query(
+                TrackerIPCCategoryMonthly,
+                basket_type=basket_type,
+                start_period=start_period,
+                end_period=end_period,
+                method_version=method_version,
+                category_slug=category_slug,
+            )
+            .where(*_mapped_category_filters())
+            .subquery("tracker")
         )
-        # Official rows keep INDEC division slug in metric_code/category_slug.
-        official_rows, _ = self.get_official_ipc_patagonia(
-            start_period=start_period,
-            end_period=end_period,
-            metric_code=None,
-            region=region,
-            source=source,
-            page=1,
-            page_size=5000,
+        # Official rows keep INDEC division slug in metric_code/category_slug;
+        # only divisions mapped by some tracker category are fetched.
+        official = (
+            self._comparison_official_query(
+                start_period=start_period,
+                end_period=end_period,
+                metric_code=None,
+                region=region,
+                source=source,
+            )
+            .where(OfficialCPIMonthly.metric_code.notin_(NON_DIVISION_METRIC_CODES))
+            .where(OfficialCPIMonthly.metric_code.in_(select(tracker.c.indec_division_code)))
+            .subquery("official")
         )
+        # Both sides come back in one round-trip, tagged by ``side``.
+        merged = union_all(
+            select(
+                literal("tracker").label("side"),
+                tracker.c.category_slug.label("series_key"),
+                tracker.c.indec_division_code,
+                tracker.c.year_month,
+                tracker.c.method_version,
+                tracker.c.status,
+                tracker.c.index_value,
+                tracker.c.mom_change,
+            ),
+            select(
+                literal("official"),
+                official.c.metric_code,
+                null(),
+                official.c.year_month,
+                null(),
+                official.c.status,
+                official.c.index_value,
+                official.c.mom_change,
+            ),
+        ).order_by("side", "series_key", "year_month")
 
-        tracker_rows = [
-            r
-            for r in tracker_rows
-            if r.get("category_slug")
-            and r.get("indec_division_code")
-            and str(r.get("indec_division_code")).strip().lower() not in {"", "none", "nan"}
-        ]
-        if category_slug:
-            tracker_rows = [r for r in tracker_rows if str(r.get("category_slug")) == str(category_slug)]
-
-        official_rows = [
-            r
-            for r in official_rows
-            if r.get("metric_code")
-            and str(r.get("metric_code")) not in {"general", "", "None"}
-        ]
-
-        tracker_by_key = {(str(r["category_slug"]), str(r["year_month"])): r for r in tracker_rows}
-        official_by_key = {(str(r["metric_code"]), str(r["year_month"])): r for r in official_rows}
+        # One pass groups rows by series and month; each category's month axis
+        # is then the union of two small per-series key sets.
+        tracker_by_category: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        official_by_division: Dict[str, Dict[str, Dict[str, Any]]] = {}
         category_to_division: Dict[str, str] = {}
-        for row in tracker_rows:
-            cat = str(row["category_slug"])
-            division = str(row["indec_division_code"])
-            category_to_division.setdefault(cat, division)
+        # year_month, category_slug and metric_code are non-null String columns,
+        # so the values are used as keys as-is.
+        # Rows are only read from here on, so the RowMapping views are kept
+        # as they are instead of being copied into dicts.
+        for row in self.session.execute(merged).mappings():
+            series_key = row["series_key"]
+            if row["side"] == "tracker":
+                tracker_by_category.setdefault(series_key, {})[row["year_month"]] = row
+                category_to_division.setdefault(series_key, str(row["indec_division_code"]))
+            else:
+                official_by_division.setdefault(series_key, {})[row["year_month"]] = row
         categories = sorted(category_to_division.keys())
 
-        rows: List[Dict[str, Any]] = []
+        # Rebase every category up front but only build row dicts for the
+        # requested page: keys are sliced before any dict exists.
+        blocks: Dict[str, Dict[str, Any]] = {}
+        keys: List[Tuple[str, str, int]] = []
         for cat in categories:
             division_code = category_to_division.get(cat)
-            months = sorted(
-                set(m for c, m in tracker_by_key.keys() if c == cat)
-                | set(m for d, m in official_by_key.keys() if d == division_code)
-            )
-            overlap = [
-                m for m in months
-                if tracker_by_key.get((cat, m), {}).get("index_value") is not None
-                and official_by_key.get((division_code, m), {}).get("index_value") is not None
-            ]
-            tracker_base = float(tracker_by_key[(cat, overlap[0])]["index_value"]) if overlap else None
-            official_base = float(official_by_key[(division_code, overlap[0])]["index_value"]) if overlap else None
-
-            for month in months:
-                tracker = tracker_by_key.get((cat, month), {})
-                official = official_by_key.get((division_code, month), {})
-                tracker_idx = tracker.get("index_value")
-                official_idx = official.get("index_value")
-                tracker_base100 = None
-                official_base100 = None
-                if tracker_idx is not None and tracker_base and tracker_base != 0:
-                    tracker_base100 = (float(tracker_idx) / tracker_base) * 100.0
-                if official_idx is not None and official_base and official_base != 0:
-                    official_base100 = (float(official_idx) / official_base) * 100.0
-                gap_index = (
-                    tracker_base100 - official_base100
-                    if tracker_base100 is not None and official_base100 is not None
-                    else None
-                )
-                tracker_mom = tracker.get("mom_change")
-                official_mom = official.get("mom_change")
-                gap_mom = (
-                    float(tracker_mom) - float(official_mom)
-                    if tracker_mom is not None and official_mom is not None
-                    else None
-                )
-                rows.append(
-                    {
-                        "category_slug": cat,
-                        "indec_division_code": division_code,
-                        "year_month": month,
-                        "basket_type": basket_type,
-                        "method_version": tracker.get("method_version"),
-                        "region": region,
-                        "tracker_index": tracker_idx,
-                        "official_index": official_idx,
-                        "tracker_mom": tracker_mom,
-                        "official_mom": official_mom,
-                        "tracker_status": tracker.get("status"),
-                        "official_status": official.get("status"),
-                        "tracker_index_base100": tracker_base100,
-                        "official_index_base100": official_base100,
-                        "gap_index_points": gap_index,
-                        "gap_mom_pp": gap_mom,
-                        "is_overlap": month in overlap,
-                    }
-                )
+            tracker_by_month = tracker_by_category[cat]
+            official_by_month = official_by_division.get(division_code, {})
+            months = sorted(tracker_by_month.keys() | official_by_month.keys())
+            trackers = [tracker_by_month.get(month, {}) for month in months]
+            officials = [official_by_month.get(month, {}) for month in months]
 
-        rows.sort(key=lambda r: (r["category_slug"], r["year_month"]))
-        total = len(rows)
+            # Rebase and diff the whole category at once; NaN marks missing values.
+            tracker_idx = _float_array(t.get("index_value") for t in trackers)
+            official_idx = _float_array(o.get("index_value") for o in officials)
+            overlap = ~np.isnan(tracker_idx) & ~np.isnan(official_idx)
+            tracker_base100 = np.full(len(months), np.nan)
+            official_base100 = np.full(len(months), np.nan)
+            if overlap.any():
+                first = int(overlap.argmax())
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    if tracker_idx[first] != 0:
+                        tracker_base100 = tracker_idx / tracker_idx[first] * 100.0
+                    if official_idx[first] != 0:
+                        official_base100 = official_idx / official_idx[first] * 100.0
+            blocks[cat] = {
+                "division_code": division_code,
+                "trackers": trackers,
+                "officials": officials,
+                "tracker_base100": tracker_base100,
+                "official_base100": official_base100,
+                "gap_index": tracker_base100 - official_base100,
+                "gap_mom": _float_array(t.get("mom_change") for t in trackers)
+                - _float_array(o.get("mom_change") for o in officials),
+                "overlap": overlap,
+            }
+            keys.extend((cat, month, i) for i, month in enumerate(months))
+
+        # Categories and each category's months are iterated in sorted order,
+        # so ``keys`` is already ordered by (category_slug, year_month).
+        total = len(keys)
         start = (page - 1) * page_size
-        paged = rows[start:start + page_size]
-        return paged, Pagination(page=page, page_size=page_size, total=total)
+        rows: List[Dict[str, Any]] = []
+        for cat, month, i in keys[start:start + page_size]:
+            block = blocks[cat]
+            tracker = block["trackers"][i]
+            official = block["officials"][i]
+            rows.append(
+                {
+                    "category_slug": cat,
+                    "indec_division_code": block["division_code"],
+                    "year_month": month,
+                    "basket_type": basket_type,
+                    "method_version": tracker.get("method_version"),
+                    "region": region,
+                    "tracker_index": tracker.get("index_value"),
+                    "official_index": official.get("index_value"),
+                    "tracker_mom": tracker.get("mom_change"),
+                    "official_mom": official.get("mom_change"),
+                    "tracker_status": tracker.get("status"),
+                    "official_status": official.get("status"),
+                    "tracker_index_base100": _nan_to_none(block["tracker_base100"][i]),
+                    "official_index_base100": _nan_to_none(block["official_base100"][i]),
+                    "gap_index_points": _nan_to_none(block["gap_index"][i]),
+                    "gap_mom_pp": _nan_to_none(block["gap_mom"][i]),
+                    "is_overlap": bool(block["overlap"][i]),
+                }
+            )
+        return rows, Pagination(page=page, page_size=page_size, total=total)
+
+    def _comparison_tracker_query(
+        self,
+        model,
+        basket_type: str,
+        start_period: Optional[str],
+        end_period: Optional[str],
+        method_version: Optional[str],
+        category_slug: Optional[str] = None,
+    ):
+        """Build the tracker query with only the columns used by comparisons.
+
+        ``model`` is either ``TrackerIPCMonthly`` or ``TrackerIPCCategoryMonthly``.
+        """
+        method = method_version or self._latest_tracker_method(basket_type) or None
+        columns = [
+            model.year_month,
+            model.method_version,
+            model.status,
+            model.index_value,
+            model.mom_change,
+        ]
+        is_category = model is TrackerIPCCategoryMonthly
+        if is_category:
+            columns[:0] = [model.category_slug, model.indec_division_code]
+        stmt = select(*columns)
+        if basket_type != "all":
+            stmt = stmt.where(model.basket_type == basket_type)
+        if category_slug and is_category:
+            stmt = stmt.where(model.category_slug == category_slug)
+        if method:
+            stmt = stmt.where(model.method_version == method)
+        if start_period:
+            stmt = stmt.where(model.year_month >= start_period)
+        if end_period:
+            stmt = stmt.where(model.year_month <= end_period)
+        return stmt
+
+    def _comparison_official_query(
+        self,
+        start_period: Optional[str],
+        end_period: Optional[str],
+        metric_code: Optional[str],
+        region: str,
+        source: Optional[str],
+    ):
+        """Build the official CPI query with only the columns used by comparisons."""
+        stmt = select(
+            OfficialCPIMonthly.metric_code,
+            OfficialCPIMonthly.year_month,
+            OfficialCPIMonthly.status,
+            OfficialCPIMonthly.index_value,
+            OfficialCPIMonthly.mom_change,
+        ).where(OfficialCPIMonthly.region == region)
+        if source:
+            stmt = stmt.where(OfficialCPIMonthly.source == source)
+        if metric_code:
+            stmt = stmt.where(OfficialCPIMonthly.metric_code == metric_code)
+        if start_period:
+            stmt = stmt.where(OfficialCPIMonthly.year_month >= start_period)
+        if end_period:
+            stmt = stmt.where(OfficialCPIMonthly.year_month <= end_period)
+        return stmt
 
     def get_latest_ipc_publication_status(
         self,
         basket_type: str = "all",
         region: str = "patagonia",
     ) -> Optional[Dict[str, Any]]:
-        query = (
-            self.session.query(
-                IPCPublicationRun.run_uuid,
-                IPCPublicationRun.status,
-                IPCPublicationRun.basket_type,
-                IPCPublicationRun.region,
-                IPCPublicationRun.method_version,
-                IPCPublicationRun.from_month,
-                IPCPublicationRun.to_month,
-                IPCPublicationRun.official_source,
-                IPCPublicationRun.official_rows,
-                IPCPublicationRun.tracker_rows,
-                IPCPublicationRun.tracker_category_rows,
-                IPCPublicationRun.overlap_months,
-                IPCPublicationRun.warnings_json,
-                IPCPublicationRun.metrics_json,
-                IPCPublicationRun.started_at,
-                IPCPublicationRun.completed_at,
-            )
-            .filter(IPCPublicationRun.region == region)
-        )
-        if basket_type != "all":
-            query = query.filter(IPCPublicationRun.basket_type == basket_type)
-        row = query.order_by(IPCPublicationRun.started_at.desc()).first()
-        if row is None:
-            return None
-        return dict(row._mapping)
+        """Latest publication run including ``warnings_json`` and ``metrics_json``."""
+        return self._latest_publication_row(_STMT_LATEST_PUBLICATION, basket_type, region)
 
-    def category_exists(self, category: str) -> bool:
-        return (
-            self.session.query(Product.id)
-            .filter(Product.category.isnot(None))
-            .filter(func.lower(Product.category) == category.lower())
-            .first()
-            is not None
-        )
+    def get_latest_ipc_publication_source(
+        self,
+        basket_type: str = "all",
+        region: str = "patagonia",
+    ) -> Optional[Dict[str, Any]]:
+        """``official_source`` and ``metrics_json`` of the latest publication run."""
+        return self._latest_publication_row(_STMT_LATEST_PUBLICATION_SOURCE, basket_type, region)
 
-    def _base_product_series_query(self):
-        return self.session.query(
-            Price.canonical_id,
-            Price.product_name,
-            Price.basket_id,
-            Price.current_price,
-            Price.original_price,
-            Price.price_per_unit,
-            Price.in_stock,
-            Price.is_promotion,
-            Price.scraped_at,
-            ScrapeRun.run_uuid,
-            ScrapeRun.started_at.label("run_started_at"),
-        ).join(ScrapeRun, Price.run_id == ScrapeRun.id)
+    def _latest_publication_row(self, statements, basket_type: str, region: str) -> Optional[Dict[str, Any]]:
+        by_basket = basket_type != "all"
+        params = {"region": region}
+        if by_basket:
+            params["basket_type"] = basket_type
+        row = self.session.execute(statements[by_basket], params).mappings().first()
+        return dict(row) if row is not None else None
+
+    def category_exists(self, category: str) -> bool:
+        # SELECT EXISTS(...) stops at the first match (served by
+        # ix_products_category) and returns a single boolean. Categories are
+        # stored lowercase, so the lookup value is normalized the same way.
+        # Answers are memoized on the session; product writes through the
+        # same session drop the memo (see ``_forget_category_lookups``).
+        key = category.strip().lower()
+        cache = self.session.info.setdefault(_CATEGORY_EXISTS_CACHE_KEY, {})
+        if key not in cache:
+            cache[key] = bool(self.session.execute(_STMT_CATEGORY_EXISTS, {"category": key}).scalar())
+        return cache[key]
 
     def _apply_series_filters(
         self,
-        query,
+        stmt,
         canonical_id: Optional[str] = None,
         basket_type: str = "all",
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ):
-        if canonical_id:
-            query = query.filter(Price.canonical_id == canonical_id)
+        start_dt: Optional[datetime] = None,
+        end_exclusive_dt: Optional[datetime] = None,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Select the prebuilt statement for the active filters; returns ``(stmt, params)``.
 
+        Bounds arrive as datetimes (public methods convert dates once via
+        ``_day_start``) and bind to DateTime-typed placeholders, so the bind
+        type never varies between calls.
+        """
+        params: Dict[str, Any] = {}
+        if canonical_id:
+            params["canonical_id"] = canonical_id
         if basket_type != "all":
-            query = query.filter(Price.basket_id == basket_type)
+            params["basket_id"] = basket_type
+        if start_dt is not None:
+            params["start_dt"] = start_dt
+        if end_exclusive_dt is not None:
+            params["end_exclusive_dt"] = end_exclusive_dt
+
+        mask = tuple(name in params for name in _SERIES_FILTER_NAMES)
+        stmt = _filtered_series_stmt(stmt, mask)
+        return stmt, params
 
-        if start_date:
-            query = query.filter(Price.scraped_at >= datetime.combine(start_date, time.min))
-        if end_date:
-            query = query.filter(Price.scraped_at <= datetime.combine(end_date, time.max))
+    def _fetch_rows(self, stmt, params: Optional[Dict[str, Any]] = None) -> List[Any]:
+        return self.session.execute(stmt, params or {}).all()
 
-        return query
+    def _stream_dicts(self, stmt, params: Dict[str, Any], chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """Execute ``stmt`` with a server-side cursor and yield one dict per row."""
+        result = self.session.execute(stmt.execution_options(yield_per=chunk_size), params)
+        keys = tuple(result.keys())
+        for partition in result.partitions():
+            for row in partition:
+                yield dict(zip(keys, row))
 
-    def _paginate_query(self, query, page: int, page_size: int) -> Tuple[List[Dict[str, Any]], Pagination]:
-        total = query.count()
-        rows = query.offset((page - 1) * page_size).limit(page_size).all()
-        return [dict(row._mapping) for row in rows], Pagination(page=page, page_size=page_size, total=total)
+    def _count_rows(self, stmt, params: Optional[Dict[str, Any]] = None) -> int:
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return int(self.session.execute(count_stmt, params or {}).scalar_one())
+
+    def _estimate_count(self, stmt, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Planner row estimate for ``stmt`` (PostgreSQL only); None when unavailable.
+
+        The EXPLAIN runs in a savepoint: a failed statement would otherwise
+        abort the request's transaction and break every later query in it.
+        """
+        try:
+            compiled = stmt.order_by(None).params(params or {}).compile(
+                dialect=self.session.get_bind().dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+            with self.session.begin_nested():
+                plan = self.session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as exc:
+            logger.debug(f"Row estimate unavailable, skipping total: {exc}")
+            return None
+
+    def _paginate_keyset(
+        self,
+        stmt,
+        order_cols,
+        cursor: str,
+        page_size: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Pagination]:
+        """Fetch the page that follows ``cursor`` by seeking on ``order_cols``.
+
+        ``order_cols`` must be a unique, non-null ordering. An empty cursor
+        starts from the beginning. No COUNT is issued: one extra row tells
+        whether more pages follow, and ``next_cursor`` is an opaque token
+        for the last row returned. Page number and total stay None.
+        """
+        stmt = stmt.add_columns(*(col.label(f"_key{i}") for i, col in enumerate(order_cols)))
+        if cursor:
+            stmt = stmt.where(tuple_(*order_cols) > tuple_(*_decode_cursor(cursor, order_cols)))
+        rows = self._fetch_rows(stmt.order_by(*(col.asc() for col in order_cols)).limit(page_size + 1), params)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        key_count = len(order_cols)
+        next_cursor = _encode_cursor(rows[-1][-key_count:]) if has_more else None
+        keys = rows[0]._fields[:-key_count] if rows else ()
+        return _rows_to_dicts(rows, keys), Pagination(
+            page=None,
+            page_size=page_size,
+            total=None,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+    def _paginate_query(
+        self,
+        stmt,
+        page: int,
+        page_size: int,
+        count: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Pagination]:
+        """Fetch one page and its total in a single round-trip.
+
+        The total rides along as a ``COUNT(*) OVER ()`` column. A separate
+        COUNT is only issued when the requested page is past the end. With
+        ``count=False`` (or ``count_mode="none"``) no total is computed
+        (``total`` is None); one extra row is fetched instead to tell whether
+        another page follows. ``count_mode="estimate"`` takes the total from
+        the planner on PostgreSQL, except on the last page where it is exact.
+        """
+        offset = (page - 1) * page_size
+        count_mode = self.count_mode if count else "none"
+        if count_mode == "estimate" and self.session.get_bind().dialect.name != "postgresql":
+            count_mode = "exact"
+        if count_mode != "exact":
+            rows = self._fetch_rows(stmt.offset(offset).limit(page_size + 1), params)
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            total = None
+            if count_mode == "estimate":
+                if not has_more and (rows or not offset):
+                    total = offset + len(rows)
+                elif has_more:
+                    estimate = self._estimate_count(stmt, params)
+                    total = max(estimate, offset + len(rows) + 1) if estimate is not None else None
+                else:
+                    total = self._count_rows(stmt, params)
+            return _rows_to_dicts(rows), Pagination(
+                page=page,
+                page_size=page_size,
+                total=total,
+                has_more=has_more,
+            )
+
+        rows = self._fetch_rows(
+            stmt.add_columns(func.count().over().label("_total")).offset(offset).limit(page_size), params
+        )
+        if rows:
+            total = int(rows[0]._total)
+        else:
+            total = self._count_rows(stmt, params) if offset else 0
+        # ``_total`` is the trailing column; zipping against the shorter key
+        # tuple drops it from every row dict.
+        keys = rows[0]._fields[:-1] if rows else ()
+        return _rows_to_dicts(rows, keys), Pagination(
+            page=page,
+            page_size=page_size,
+            total=total,
+            has_more=offset + len(rows) < total,
+        )
@@ -1,20 +1,23 @@
 """Playwright-based scraper for La Anonima supermarket."""
 
+import heapq
 import json
 import re
+import threading
 import time
 import unicodedata
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from pathlib import Path
 from time import perf_counter
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Callable, Dict, List, Optional, Tuple, Any, Set
 from urllib.parse import quote, urljoin, urlsplit, urlunsplit
 
 from loguru import logger
 from playwright.sync_api import Error as PlaywrightError, Page, sync_playwright, TimeoutError as PlaywrightTimeout
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 
 from src.basket_planner import build_scrape_plan
 from src.config_loader import (
@@ -30,11 +33,253 @@ from src.models import (
 )
 
 
+_PRICE_TRANSLATION = str.maketrans({"$": None, ".": None, " ": None, ",": "."})
+_PRICE_NUMBER_RE = re.compile(r"[\d.]+")
+
+# Presentation patterns tried in order: "<qty> <unit>" first, then "<unit> <qty>".
+_PRES_PATTERNS = (
+    re.compile(r"(?P<qty>\d+[\.,]?\d*)\s*(?P<unit>kg|kilo(?:s)?|g|grs?|gramos?|l|lt?s?|litros?|ml|mililitros?|cc|c\.?c\.?|cm3|cm³|centimetros?\s*cubicos?|un|u|unidad(?:es)?)\b"),
+    re.compile(r"\b(?P<unit>kg|g|l|ml|cc|c\.?c\.?|cm3|cm³|un|u)\s*(?P<qty>\d+[\.,]?\d*)\b"),
+)
+
+_UNIT_ALIASES = {
+    "kg": "kg",
+    "kilo": "kg",
+    "kilos": "kg",
+    "g": "g",
+    "gr": "g",
+    "grs": "g",
+    "gramo": "g",
+    "gramos": "g",
+    "l": "l",
+    "lt": "l",
+    "lts": "l",
+    "litro": "l",
+    "litros": "l",
+    "ml": "ml",
+    "mililitro": "ml",
+    "mililitros": "ml",
+    "un": "un",
+    "u": "un",
+    "unidad": "un",
+    "unidades": "un",
+}
+_CUBIC_CENTIMETER_ALIASES = frozenset({"cc", "cm3", "centimetrocubico", "centimetroscubicos"})
+
+
+_DEBUG_LEVEL_NO = logger.level("DEBUG").no
+
+CANDIDATE_AUDIT_DIR = Path("data/analysis/scrape_audits")
+
+# Markers the search page shows when a query has no results.
+_EMPTY_SEARCH_MARKERS = (
+    ".sin-resultado",
+    ".resultado-vacio",
+    "text=No hay productos",
+    "text=No se obtuvieron resultados",
+)
+
+# Stylesheets stay enabled: visibility checks on selectors depend on them.
+_DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+_DEFAULT_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "connect.facebook.net",
+)
+
+# Reads every product card field in one call; mirrors the locator fallbacks in
+# LaAnonimaScraper._parse_product (first non-empty innerText, first non-null href).
+_CARD_FIELDS_JS = """
+(el, sel) => {
+    const firstText = (selectors) => {
+        for (const selector of selectors) {
+            if (!selector) continue;
+            const node = el.querySelector(selector);
+            if (!node) continue;
+            const text = (node.innerText || "").trim();
+            if (text) return text;
+        }
+        return null;
+    };
+    let href = null;
+    for (const selector of sel.url) {
+        if (!selector) continue;
+        const node = el.querySelector(selector);
+        if (!node) continue;
+        const value = node.getAttribute("href");
+        if (value !== null) {
+            href = value;
+            break;
+        }
+    }
+    return {
+        name: firstText(sel.name),
+        price: firstText(sel.price),
+        old_price: firstText([sel.old_price]),
+        unit_price: firstText([sel.unit_price]),
+        href: href,
+        out_of_stock: el.querySelector(sel.out_of_stock) !== null,
+        card_text: el.innerText || "",
+    };
+}
+"""
+
+_CARD_LIST_FIELDS_JS = (
+    "(els, [sel, limit]) => {\n"
+    "    const readCard = " + _CARD_FIELDS_JS.strip() + ";\n"
+    "    return { total: els.length, cards: els.slice(0, limit).map((el) => readCard(el, sel)) };\n"
+    "}"
+)
+
+# First list selector with matches, resolved and read in the page in one call.
+# Returns null when a selector is not plain CSS so the locator path can handle it.
+_SEARCH_RESULTS_JS = (
+    "([listSelectors, sel, limit]) => {\n"
+    "    const readCard = " + _CARD_FIELDS_JS.strip() + ";\n"
+    "    for (const selector of listSelectors) {\n"
+    "        let els;\n"
+    "        try {\n"
+    "            els = Array.from(document.querySelectorAll(selector));\n"
+    "        } catch (e) {\n"
+    "            return null;\n"
+    "        }\n"
+    "        if (els.length) {\n"
+    "            return { total: els.length, cards: els.slice(0, limit).map((el) => readCard(el, sel)) };\n"
+    "        }\n"
+    "    }\n"
+    "    return { total: 0, cards: [] };\n"
+    "}"
+)
+
+_DETAIL_TEXT_SELECTORS = {
+    "name": [
+        "h1.nombre-producto",
+        ".detalle-producto h1",
+        "h1[itemprop='name']",
+        ".ficha-producto .nombre-producto",
+    ],
+    "price": [
+        ".detalle-producto .precio-actual",
+        ".ficha-producto .precio-actual",
+        ".contenedor-precios .precio-actual",
+        "[itemprop='price']",
+    ],
+    "unit_price": [
+        ".detalle-producto .precio-unitario",
+        ".ficha-producto .precio-unitario",
+        ".contenedor-precios .precio-unitario",
+        ".precio-por-unidad",
+    ],
+}
+
+# Per field, the text of the first selector whose first match is visible and non-empty.
+_DETAIL_TEXTS_JS = """
+(fields) => {
+    const visibleText = (selector) => {
+        const node = document.querySelector(selector);
+        if (!node) return null;
+        const rect = node.getBoundingClientRect();
+        if (!(rect.width > 0 && rect.height > 0)) return null;
+        if (getComputedStyle(node).visibility === "hidden") return null;
+        return (node.innerText || "").trim() || null;
+    };
+    const out = {};
+    for (const [field, selectors] of Object.entries(fields)) {
+        out[field] = null;
+        for (const selector of selectors) {
+            const text = visibleText(selector);
+            if (text) {
+                out[field] = text;
+                break;
+            }
+        }
+    }
+    return out;
+}
+"""
+
+# DOM helpers for the branch modal, injected once per browser context so
+# select_branch only sends short calls instead of full scripts.
+_BRANCH_HELPERS_SCRIPT = """
+window.__laAnonimaBranch = {
+    openModal(selectors) {
+        for (const selector of selectors) {
+            let el = null;
+            try {
+                el = document.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            if (el) {
+                el.click();
+                return true;
+            }
+        }
+        const modal = document.querySelector("#codigo-postal");
+        if (modal) {
+            modal.classList.add("is-open");
+            modal.style.display = "block";
+            return true;
+        }
+        return false;
+    },
+    setPostalCode(selector, value) {
+        const input = document.querySelector(selector);
+        if (!input) return false;
+        input.value = value;
+        input.dispatchEvent(new Event("input", { bubbles: true }));
+        input.dispatchEvent(new Event("change", { bubbles: true }));
+        return true;
+    },
+    selectBranch(branchId, confirmSel) {
+        const radio = document.querySelector(
+            "input[name='sucursalSuper'][value='" + branchId + "']"
+        );
+        if (!radio) return false;
+        radio.checked = true;
+        radio.dispatchEvent(new Event("change", { bubbles: true }));
+        const btn = document.querySelector(confirmSel);
+        if (btn) btn.click();
+        else if (typeof setSucursalSuper === "function") setSucursalSuper();
+        return true;
+    },
+};
+"""
+
+
 def _utcnow_naive() -> datetime:
     """Return UTC datetime without tzinfo for DB compatibility."""
     return datetime.utcnow()
 
 
+def _debug_logging_enabled() -> bool:
+    """Return True when some loguru sink accepts DEBUG records."""
+    try:
+        return logger._core.min_level <= _DEBUG_LEVEL_NO
+    except AttributeError:
+        return True
+
+
+def _write_bytes_in_background(path: Path, data: bytes, label: str) -> None:
+    """Write a diagnostic artifact off the calling thread and log once it is on disk.
+
+    The thread is non-daemon so interpreter shutdown waits for the write.
+    """
+
+    def _write() -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        except OSError as exc:
+            logger.warning(f"Could not write {label.lower()} to {path}: {exc}")
+        else:
+            logger.info(f"{label} saved to {path}")
+
+    threading.Thread(target=_write, name="scraper-artifact-writer").start()
+
+
 class BranchSelectionError(Exception):
     """Raised when branch selection fails."""
     pass
@@ -201,20 +446,29 @@ class LaAnonimaScraper:
                 self.scraping_config.get("search_settle_delay_ms", 700),
             )
         )
+        # "commit" returns from search navigation as soon as the response starts and
+        # lets _wait_for_search_settle wait for the first card/empty marker instead.
+        self.search_wait_until = str(perf_cfg.get("search_wait_until", "domcontentloaded")).strip().lower()
+        if self.search_wait_until not in {"commit", "domcontentloaded", "load"}:
+            self.search_wait_until = "domcontentloaded"
         
         self.headless = headless if headless is not None else self.scraping_config.get("browser", {}).get("headless", True)
         
         # Selectors
         self.selectors = self.scraping_config.get("selectors", {})
+        # Bound dict lookup: callers treat a missing key (None) like an empty selector.
+        self._get_selector: Callable[[str], Optional[str]] = self.selectors.get
         
         # State
         self.page: Optional[Page] = None
+        self.detail_page: Optional[Page] = None
         self.playwright = None
         self.browser = None
         self.context = None
         self.current_branch: Optional[str] = None
         self._branch_attempt = 0
         self._semantic_rules_cache: Dict[str, Dict[str, Any]] = {}
+        self._basket_item_cache: Dict[str, Dict[str, Any]] = {}
         
         logger.info(f"Scraper initialized (headless={self.headless})")
     
@@ -262,11 +516,36 @@ class LaAnonimaScraper:
             });
         """)
         
+        self.context.add_init_script(_BRANCH_HELPERS_SCRIPT)
+        self._install_request_filter(browser_config)
+        
         self.page = self.context.new_page()
         self.page.set_default_timeout(self.timeout)
         
         logger.info("Browser started successfully")
     
+    def _install_request_filter(self, browser_config: Dict[str, Any]) -> None:
+        """Abort requests the scraper never reads (images, fonts, media, trackers)."""
+        blocked_types = set(
+            browser_config.get("blocked_resource_types", _DEFAULT_BLOCKED_RESOURCE_TYPES) or ()
+        )
+        blocked_hosts = tuple(
+            browser_config.get("blocked_hosts", _DEFAULT_BLOCKED_HOSTS) or ()
+        )
+        if not blocked_types and not blocked_hosts:
+            return
+
+        def _filter(route) -> None:
+            request = route.request
+            if request.resource_type in blocked_types or (
+                blocked_hosts and any(host in request.url for host in blocked_hosts)
+            ):
+                route.abort()
+            else:
+                route.continue_()
+
+        self.context.route("**/*", _filter)
+
     def stop(self):
         """Stop the browser and cleanup."""
         logger.info("Stopping browser...")
@@ -286,6 +565,7 @@ class LaAnonimaScraper:
             except Exception:
                 pass
         self.page = None
+        self.detail_page = None
         self.context = None
         self.browser = None
         self.playwright = None
@@ -298,6 +578,24 @@ class LaAnonimaScraper:
             return True
         return "target page, context or browser has been closed" in text or "target closed" in text
 
+    def _get_detail_page(self) -> Page:
+        """Return a second page in the same context for product detail visits.
+
+        Opening details there leaves the search results on ``self.page`` intact,
+        so the next candidate does not need another search navigation.
+        """
+        if self.detail_page is not None:
+            try:
+                if not self.detail_page.is_closed():
+                    return self.detail_page
+            except Exception:
+                pass
+        if self.context is None:
+            return self.page
+        self.detail_page = self.context.new_page()
+        self.detail_page.set_default_timeout(self.timeout)
+        return self.detail_page
+
     def _ensure_browser_session(self):
         """Recover page/context when Playwright target got closed between retries."""
         should_restart = self.page is None
@@ -308,10 +606,24 @@ class LaAnonimaScraper:
             except Exception:
                 should_restart = True
 
-        if should_restart:
-            logger.warning("Browser page not available; restarting browser session before retry.")
-            self.stop()
-            self.start()
+        if not should_restart:
+            return
+
+        # Prefer a fresh page in the still-running context: it keeps cookies (branch)
+        # and skips the Chromium cold start. Fall back to a full restart otherwise.
+        if self.context is not None and self.browser is not None:
+            try:
+                if self.browser.is_connected():
+                    self.page = self.context.new_page()
+                    self.page.set_default_timeout(self.timeout)
+                    logger.warning("Browser page not available; opened a new page in the existing context.")
+                    return
+            except Exception:
+                pass
+
+        logger.warning("Browser page not available; restarting browser session before retry.")
+        self.stop()
+        self.start()
     
     def __enter__(self):
         self.start()
@@ -320,10 +632,6 @@ class LaAnonimaScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
     
-    def _get_selector(self, key: str) -> str:
-        """Get a CSS selector from config."""
-        return self.selectors.get(key, "")
-
     def _detect_anti_bot_marker(self) -> Optional[str]:
         """Return marker text when landing page appears to be a bot challenge."""
         if not self.page:
@@ -410,32 +718,78 @@ class LaAnonimaScraper:
         target_city = target_branch.split()[0].strip().lower() if target_branch else ""
 
         selectors_to_try = [
-            self._get_selector("current_branch_label"),
-            ".sucursal-actual",
-            ".sucursal",
-            ".branch-name",
-            "[data-branch-name]",
-            ".sucursal-seleccionada",
-            ".header-sucursal",
+            selector
+            for selector in (
+                self._get_selector("current_branch_label"),
+                ".sucursal-actual",
+                ".sucursal",
+                ".branch-name",
+                "[data-branch-name]",
+                ".sucursal-seleccionada",
+                ".header-sucursal",
+            )
+            if selector
         ]
-        for selector in selectors_to_try:
+
+        def _label_state(text: str) -> Tuple[bool, Optional[str]]:
+            text_lower = text.lower()
+            if (
+                (target_branch and target_branch.lower() in text_lower)
+                or (target_city and target_city in text_lower)
+                or (target_postal_code and target_postal_code in text)
+            ):
+                return True, text
+            return False, text
+
+        # Probe all label selectors in one round-trip, in priority order. The probe
+        # stops at the first selector querySelector cannot parse (e.g. Playwright-only
+        # syntax) and the locator loop below resumes from there.
+        resume_at = 0
+        try:
+            probe = self.page.evaluate(
+                """(selectors) => {
+                    for (let i = 0; i < selectors.length; i++) {
+                        let el = null;
+                        try {
+                            el = document.querySelector(selectors[i]);
+                        } catch (e) {
+                            return { text: null, resume: i };
+                        }
+                        if (!el) {
+                            continue;
+                        }
+                        const rect = el.getBoundingClientRect();
+                        if (!(rect.width > 0 && rect.height > 0)) {
+                            continue;
+                        }
+                        if (getComputedStyle(el).visibility === "hidden") {
+                            continue;
+                        }
+                        const text = (el.innerText || "").trim();
+                        if (text) {
+                            return { text: text, resume: -1 };
+                        }
+                    }
+                    return { text: null, resume: selectors.length };
+                }""",
+                selectors_to_try,
+            ) or {}
+            probe_text = str(probe.get("text") or "").strip()
+            if probe_text:
+                return _label_state(probe_text)
+            resume_at = int(probe.get("resume", 0))
+        except Exception:
+            resume_at = 0
+
+        for selector in selectors_to_try[max(resume_at, 0):]:
             try:
-                if not selector:
-                    continue
                 element = self.page.locator(selector).first
                 if not element.is_visible(timeout=min(2000, self.branch_probe_timeout_ms)):
                     continue
                 text = (element.inner_text() or "").strip()
                 if not text:
                     continue
-                text_lower = text.lower()
-                if (
-                    (target_branch and target_branch.lower() in text_lower)
-                    or (target_city and target_city in text_lower)
-                    or (target_postal_code and target_postal_code in text)
-                ):
-                    return True, text
-                return False, text
+                return _label_state(text)
             except Exception:
                 continue
 
@@ -522,26 +876,56 @@ class LaAnonimaScraper:
         try:
             out_dir = Path("data/logs")
             out_dir.mkdir(parents=True, exist_ok=True)
-            out_path = out_dir / f"branch_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            out_path = out_dir / f"branch_debug_{time.strftime('%Y%m%d_%H%M%S')}.html"
             out_path.write_text(self.page.content(), encoding="utf-8")
             return str(out_path)
         except Exception:
             return None
 
     @staticmethod
+    @lru_cache(maxsize=2048)
+    def _absolute_product_url(href: str) -> str:
+        """Resolve a card href against the store origin."""
+        # Plain root-relative paths are concatenated; anything urljoin would
+        # rewrite (dot segments, params, whitespace, scheme-relative) goes through it.
+        if (
+            href.startswith("/")
+            and not href.startswith("//")
+            and "/." not in href
+            and ";" not in href
+            and href.isprintable()
+            and href == href.rstrip()
+        ):
+            return "https://www.laanonima.com.ar" + href
+        return urljoin("https://www.laanonima.com.ar/", href)
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
     def _canonical_product_url(url: Optional[str]) -> str:
         """Canonicalize product URL by dropping query params and fragments."""
         if not url:
             return ""
 
+        # Fast path for the absolute http(s) URLs the site emits; anything else
+        # (relative, empty host, unusual scheme casing, control chars) goes through urlsplit.
+        if (
+            url.startswith(("https://", "http://"))
+            and not url.startswith(("https:///", "http:///"))
+            and url.isprintable()
+        ):
+            return url.split("#", 1)[0].split("?", 1)[0]
+
         parsed = urlsplit(url)
         return urlunsplit((parsed.scheme, parsed.netloc, parsed.path, "", ""))
 
-    def _is_valid_product_url(self, url: Optional[str]) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _is_valid_product_url(url: Optional[str]) -> bool:
         """Validate La Anonima product URL format."""
-        return "/art_" in self._canonical_product_url(url)
+        return "/art_" in LaAnonimaScraper._canonical_product_url(url)
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _normalize_unit(unit: Optional[str]) -> Optional[str]:
         """Normalize unit aliases to canonical units used for matching."""
         if not unit:
@@ -549,31 +933,9 @@ class LaAnonimaScraper:
 
         normalized = unit.strip().lower().replace("³", "3")
         compact = normalized.replace(".", "").replace(" ", "")
-        aliases = {
-            "kg": "kg",
-            "kilo": "kg",
-            "kilos": "kg",
-            "g": "g",
-            "gr": "g",
-            "grs": "g",
-            "gramo": "g",
-            "gramos": "g",
-            "l": "l",
-            "lt": "l",
-            "lts": "l",
-            "litro": "l",
-            "litros": "l",
-            "ml": "ml",
-            "mililitro": "ml",
-            "mililitros": "ml",
-            "un": "un",
-            "u": "un",
-            "unidad": "un",
-            "unidades": "un",
-        }
-        if compact in {"cc", "cm3", "centimetrocubico", "centimetroscubicos"}:
+        if compact in _CUBIC_CENTIMETER_ALIASES:
             return "ml"
-        return aliases.get(normalized, aliases.get(compact, compact))
+        return _UNIT_ALIASES.get(normalized, _UNIT_ALIASES.get(compact, compact))
 
     @staticmethod
     def _normalize_text(text: str) -> str:
@@ -628,13 +990,17 @@ class LaAnonimaScraper:
                 markers.add(marker)
         return markers
 
-    def _semantic_rules_for_item(self, basket_item: Dict[str, Any]) -> Dict[str, Any]:
-        cache_key = str(
+    @staticmethod
+    def _basket_item_cache_key(basket_item: Dict[str, Any]) -> str:
+        return str(
             basket_item.get("id")
             or basket_item.get("canonical_id")
             or basket_item.get("name")
             or id(basket_item)
         )
+
+    def _semantic_rules_for_item(self, basket_item: Dict[str, Any]) -> Dict[str, Any]:
+        cache_key = self._basket_item_cache_key(basket_item)
         cached = self._semantic_rules_cache.get(cache_key)
         if cached is not None:
             return cached
@@ -797,20 +1163,21 @@ class LaAnonimaScraper:
                 return numeric_price / qty
         return numeric_price
 
-    def _parse_presentation_from_name(self, name: str) -> Dict[str, Any]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_presentation_from_name(name: str) -> Tuple[Optional[float], Optional[str]]:
         """Extract presentation amount/unit from product name.
 
-        Returns quantity in the parsed unit (kg, g, l, ml, un) when detectable.
+        Returns ``(quantity, unit)`` in the parsed unit (kg, g, l, ml, un) when
+        detectable, ``(None, None)`` otherwise. Results are cached per name.
         """
         normalized_name = (name or "").lower()
+        # Both patterns require a quantity, so names without digits never match.
+        if not any(ch.isdigit() for ch in normalized_name):
+            return None, None
 
-        patterns = [
-            r"(?P<qty>\d+[\.,]?\d*)\s*(?P<unit>kg|kilo(?:s)?|g|grs?|gramos?|l|lt?s?|litros?|ml|mililitros?|cc|c\.?c\.?|cm3|cm³|centimetros?\s*cubicos?|un|u|unidad(?:es)?)\b",
-            r"\b(?P<unit>kg|g|l|ml|cc|c\.?c\.?|cm3|cm³|un|u)\s*(?P<qty>\d+[\.,]?\d*)\b",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, normalized_name)
+        for pattern in _PRES_PATTERNS:
+            match = pattern.search(normalized_name)
             if not match:
                 continue
 
@@ -820,19 +1187,14 @@ class LaAnonimaScraper:
             except ValueError:
                 continue
 
-            unit = self._normalize_unit(match.group("unit"))
+            unit = LaAnonimaScraper._normalize_unit(match.group("unit"))
             if unit in {"kg", "g", "l", "ml", "un"}:
-                return {
-                    "presentation_quantity": quantity,
-                    "presentation_unit": unit,
-                }
+                return quantity, unit
 
-        return {
-            "presentation_quantity": None,
-            "presentation_unit": None,
-        }
+        return None, None
 
-    def _convert_quantity(self, quantity: float, unit: str, target_unit: str) -> Optional[float]:
+    @staticmethod
+    def _convert_quantity(quantity: float, unit: str, target_unit: str) -> Optional[float]:
         """Convert quantity to target unit when conversion is possible."""
         if unit == target_unit:
             return quantity
@@ -880,9 +1242,8 @@ class LaAnonimaScraper:
         product_unit = self._normalize_unit(product.get("presentation_unit"))
         product_qty = product.get("presentation_quantity")
         if product_unit is None or product_qty is None:
-            parsed = self._parse_presentation_from_name(str(product.get("name") or ""))
-            product_unit = self._normalize_unit(parsed.get("presentation_unit"))
-            product_qty = parsed.get("presentation_quantity")
+            product_qty, parsed_unit = self._parse_presentation_from_name(str(product.get("name") or ""))
+            product_unit = self._normalize_unit(parsed_unit)
         if product_unit is None or product_qty is None:
             return None
 
@@ -921,125 +1282,226 @@ class LaAnonimaScraper:
         relative_delta = abs(cand_value - ref_value) / ref_value
         return relative_delta <= self.intra_tier_size_tolerance_ratio
 
-    def _score_product_match(
-        self,
-        product: Dict[str, Any],
-        basket_item: Dict[str, Any],
-    ) -> Tuple[float, Dict[str, Any], Tuple[int, int, int]]:
-        """Compute product match score and tie-break tuple for deterministic ranking."""
-        keywords = [k.lower() for k in basket_item.get("keywords", [])]
-        brand_hints = [b.lower() for b in basket_item.get("brand_hint", [])]
-        matching = basket_item.get("matching", "loose")
-
-        product_name = product.get("name", "").lower()
-        score = 0.0
-        breakdown: Dict[str, Any] = {}
-
-        keyword_matches = sum(1 for kw in keywords if kw in product_name)
-        keyword_score = (keyword_matches / len(keywords)) * 0.6 if keywords else 0.0
-        score += keyword_score
-        breakdown["keyword_score"] = round(keyword_score, 4)
-
-        if keywords and keyword_matches == 0:
-            breakdown["keyword_gate_rejected"] = True
-            logger.debug(
-                "Score breakdown {}: {} (keyword gate)",
-                product.get("name", "<sin nombre>"),
-                breakdown,
-            )
-            return 0.0, breakdown, (0, 0, 0)
-
-        semantic_ok, semantic_debug = self._passes_semantic_guard(product, basket_item)
-        breakdown["semantic"] = semantic_debug
-        if not semantic_ok:
-            logger.debug(
-                "Score breakdown {}: {} (semantic gate)",
-                product.get("name", "<sin nombre>"),
-                breakdown,
-            )
-            return 0.0, breakdown, (0, 0, 0)
-
-        brand_score = 0.0
-        if brand_hints:
-            brand_matches = sum(1 for brand in brand_hints if brand in product_name)
-            brand_score = (brand_matches / len(brand_hints)) * 0.3
-            score += brand_score
-        breakdown["brand_score"] = round(brand_score, 4)
-
-        stock_bonus = 0.1 if product.get("in_stock") else 0.0
-        score += stock_bonus
-        breakdown["stock_bonus"] = round(stock_bonus, 4)
-
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _presentation_scores(
+        product_unit: Optional[str],
+        product_quantity: Any,
+        target_unit: Optional[str],
+        target_quantity: Any,
+    ) -> Tuple[float, float, float]:
+        """Return (presentation_bonus, quantity_bonus, size_penalty) for a candidate.
+
+        Pure function of the normalized presentation pair, cached because the
+        same sizes recur across candidates and basket items.
+        """
+        convert = LaAnonimaScraper._convert_quantity
         presentation_bonus = 0.0
+        quantity_bonus = 0.0
         size_penalty = 0.0
-        target_unit = self._normalize_unit(basket_item.get("unit"))
-        target_quantity = basket_item.get("quantity")
-
-        product_unit = self._normalize_unit(product.get("presentation_unit"))
-        product_quantity = product.get("presentation_quantity")
 
         comparable_quantity = None
         if product_unit and target_unit:
             if product_unit == target_unit:
                 presentation_bonus = 0.15
             else:
-                converted = self._convert_quantity(float(product_quantity), product_unit, target_unit) if product_quantity is not None else None
+                converted = convert(float(product_quantity), product_unit, target_unit) if product_quantity is not None else None
                 if converted is not None:
                     comparable_quantity = converted
                     presentation_bonus = 0.1
                 else:
                     presentation_bonus = -0.2
 
-        score += presentation_bonus
-        breakdown["presentation_bonus"] = round(presentation_bonus, 4)
-
         if target_quantity is not None and product_quantity is not None and target_unit and product_unit:
             try:
                 target_quantity_value = float(target_quantity)
                 if comparable_quantity is None:
-                    comparable_quantity = self._convert_quantity(float(product_quantity), product_unit, target_unit)
+                    comparable_quantity = convert(float(product_quantity), product_unit, target_unit)
                 if comparable_quantity is None and product_unit == target_unit:
                     comparable_quantity = float(product_quantity)
 
                 if comparable_quantity is not None and target_quantity_value > 0:
                     relative_delta = abs(comparable_quantity - target_quantity_value) / target_quantity_value
-                    qty_score = max(0.0, 0.2 * (1 - relative_delta))
-                    score += qty_score
-                    breakdown["quantity_bonus"] = round(qty_score, 4)
-
+                    quantity_bonus = max(0.0, 0.2 * (1 - relative_delta))
                     if relative_delta >= 0.5:
                         size_penalty = min(0.3, 0.3 * relative_delta)
-                        score -= size_penalty
-                else:
-                    breakdown["quantity_bonus"] = 0.0
             except (TypeError, ValueError):
-                breakdown["quantity_bonus"] = 0.0
+                quantity_bonus = 0.0
+
+        return presentation_bonus, quantity_bonus, size_penalty
+
+    @staticmethod
+    def _product_name_lower(product: Dict[str, Any]) -> str:
+        """Return the lowered product name, reusing the one stored at parse time."""
+        name_lower = product.get("_name_lower")
+        if name_lower is None:
+            name_lower = str(product.get("name") or "").lower()
+        return name_lower
+
+    def _prepare_basket_item(self, basket_item: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute basket-item inputs shared by every candidate score.
+
+        Cached only for items with an explicit ``id`` or ``canonical_id``, so repeated
+        searches for the same item reuse the lowered terms and compiled pattern.
+        Items without one are recomputed: a name or object identity is not a
+        stable enough key to reuse scoring inputs across calls.
+        """
+        item_id = basket_item.get("id") or basket_item.get("canonical_id")
+        cache_key = str(item_id) if item_id else None
+        if cache_key is not None:
+            cached = self._basket_item_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        keywords = tuple(k.lower() for k in basket_item.get("keywords", []))
+        brand_hints = tuple(b.lower() for b in basket_item.get("brand_hint", []))
+        prepared = {
+            "keywords": keywords,
+            "brand_hints": brand_hints,
+            # Distinct keyword/brand terms, so a term listed in both is only scanned once.
+            "match_terms": tuple(dict.fromkeys(keywords + brand_hints)),
+            "keyword_pattern": (
+                re.compile("|".join(re.escape(kw) for kw in keywords)) if keywords else None
+            ),
+            "matching": basket_item.get("matching", "loose"),
+            "target_unit": self._normalize_unit(basket_item.get("unit")),
+            "target_quantity": basket_item.get("quantity"),
+        }
+        if cache_key is not None:
+            self._basket_item_cache[cache_key] = prepared
+        return prepared
+
+    def prepare_basket_items(self, basket_items: List[Dict[str, Any]]) -> None:
+        """Warm the per-item scoring and semantic caches before scraping starts.
+
+        Keeps the CPU-side setup out of the per-item loop, which is otherwise
+        paced by browser round-trips.
+        """
+        for basket_item in basket_items:
+            self._prepare_basket_item(basket_item)
+            self._semantic_rules_for_item(basket_item)
+
+    def _score_products(
+        self,
+        products: List[Dict[str, Any]],
+        basket_item: Dict[str, Any],
+    ) -> List[Tuple[float, Dict[str, Any], Tuple[int, int, int]]]:
+        """Score all candidates for one basket item, sharing item-level setup."""
+        context = self._prepare_basket_item(basket_item)
+        score_match = self._score_product_match
+        return [score_match(product, basket_item, context) for product in products]
+
+    def _score_product_match(
+        self,
+        product: Dict[str, Any],
+        basket_item: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[float, Dict[str, Any], Tuple[int, int, int]]:
+        """Compute product match score and tie-break tuple for deterministic ranking.
+
+        The per-component breakdown is only filled in when DEBUG logging is
+        enabled; otherwise an empty dict is returned in its place.
+        """
+        if context is None:
+            context = self._prepare_basket_item(basket_item)
+        keywords = context["keywords"]
+        brand_hints = context["brand_hints"]
+        matching = context["matching"]
+        get = product.get
+
+        product_name = self._product_name_lower(product)
+        score = 0.0
+        breakdown: Dict[str, Any] = {}
+        explain = _debug_logging_enabled()
+
+        keyword_pattern = context["keyword_pattern"]
+        if keyword_pattern is not None and keyword_pattern.search(product_name) is None:
+            # No keyword occurs anywhere in the name: the keyword gate below rejects it.
+            term_hits: Set[str] = set()
         else:
-            breakdown["quantity_bonus"] = 0.0
+            term_hits = {term for term in context["match_terms"] if term in product_name}
+        keyword_matches = sum(1 for kw in keywords if kw in term_hits)
+        keyword_score = (keyword_matches / len(keywords)) * 0.6 if keywords else 0.0
+        score += keyword_score
+        if explain:
+            breakdown["keyword_score"] = round(keyword_score, 4)
+
+        if keywords and keyword_matches == 0:
+            if explain:
+                breakdown["keyword_gate_rejected"] = True
+                logger.debug(
+                    "Score breakdown {}: {} (keyword gate)",
+                    get("name", "<sin nombre>"),
+                    breakdown,
+                )
+            return 0.0, breakdown, (0, 0, 0)
 
-        if size_penalty:
+        semantic_ok, semantic_debug = self._passes_semantic_guard(product, basket_item)
+        if explain:
+            breakdown["semantic"] = semantic_debug
+        if not semantic_ok:
+            if explain:
+                logger.debug(
+                    "Score breakdown {}: {} (semantic gate)",
+                    get("name", "<sin nombre>"),
+                    breakdown,
+                )
+            return 0.0, breakdown, (0, 0, 0)
+
+        brand_score = 0.0
+        if brand_hints:
+            brand_matches = sum(1 for brand in brand_hints if brand in term_hits)
+            brand_score = (brand_matches / len(brand_hints)) * 0.3
+            score += brand_score
+        if explain:
+            breakdown["brand_score"] = round(brand_score, 4)
+
+        stock_bonus = 0.1 if get("in_stock") else 0.0
+        score += stock_bonus
+        if explain:
+            breakdown["stock_bonus"] = round(stock_bonus, 4)
+
+        product_unit = self._normalize_unit(get("presentation_unit"))
+        presentation_bonus, quantity_bonus, size_penalty = self._presentation_scores(
+            product_unit,
+            get("presentation_quantity"),
+            context["target_unit"],
+            context["target_quantity"],
+        )
+        score += presentation_bonus
+        if explain:
+            breakdown["presentation_bonus"] = round(presentation_bonus, 4)
+        score += quantity_bonus
+        if explain:
+            breakdown["quantity_bonus"] = round(quantity_bonus, 4)
+        score -= size_penalty
+
+        if size_penalty and explain:
             breakdown["large_size_penalty"] = round(size_penalty, 4)
 
-        if not product.get("url_valid", False):
+        if not get("url_valid", False):
             score *= 0.3
-            breakdown["url_penalty_multiplier"] = 0.3
+            if explain:
+                breakdown["url_penalty_multiplier"] = 0.3
 
         if matching == "strict" and keywords and keyword_matches < len(keywords):
-            breakdown["strict_matching_rejected"] = True
-            logger.debug(
-                "Score breakdown {}: {} (strict mismatch)",
-                product.get("name", "<sin nombre>"),
-                breakdown,
-            )
+            if explain:
+                breakdown["strict_matching_rejected"] = True
+                logger.debug(
+                    "Score breakdown {}: {} (strict mismatch)",
+                    get("name", "<sin nombre>"),
+                    breakdown,
+                )
             return 0.0, breakdown, (0, 0, 0)
 
         tie_break = (
-            1 if product.get("in_stock") else 0,
-            1 if self._is_valid_product_url(product.get("url")) else 0,
-            1 if product.get("price") is not None else 0,
+            1 if get("in_stock") else 0,
+            1 if self._is_valid_product_url(get("url")) else 0,
+            1 if get("price") is not None else 0,
         )
 
-        logger.debug("Score breakdown {}: {}", product.get("name", "<sin nombre>"), breakdown)
+        if explain:
+            logger.debug("Score breakdown {}: {}", get("name", "<sin nombre>"), breakdown)
         return score, breakdown, tie_break
     
     def check_branch_set(self) -> Tuple[bool, Optional[str]]:
@@ -1062,7 +1524,7 @@ class LaAnonimaScraper:
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=wait_exponential_jitter(initial=1, max=8, jitter=2),
         retry=retry_if_exception_type((PlaywrightTimeout, BranchSelectionError)),
         reraise=True
     )
@@ -1201,27 +1663,7 @@ class LaAnonimaScraper:
 
                 if not trigger_opened:
                     trigger_opened = self.page.evaluate(
-                        """(selectors) => {
-                            for (const selector of selectors) {
-                                let el = null;
-                                try {
-                                    el = document.querySelector(selector);
-                                } catch (e) {
-                                    continue;
-                                }
-                                if (el) {
-                                    el.click();
-                                    return true;
-                                }
-                            }
-                            const modal = document.querySelector("#codigo-postal");
-                            if (modal) {
-                                modal.classList.add("is-open");
-                                modal.style.display = "block";
-                                return true;
-                            }
-                            return false;
-                        }""",
+                        "(selectors) => window.__laAnonimaBranch.openModal(selectors)",
                         js_safe_trigger_selectors,
                     )
                     if trigger_opened:
@@ -1258,14 +1700,7 @@ class LaAnonimaScraper:
                 postal_input.press("Tab")
             else:
                 set_ok = self.page.evaluate(
-                    """([selector, value]) => {
-                        const input = document.querySelector(selector);
-                        if (!input) return false;
-                        input.value = value;
-                        input.dispatchEvent(new Event("input", { bubbles: true }));
-                        input.dispatchEvent(new Event("change", { bubbles: true }));
-                        return true;
-                    }""",
+                    "([selector, value]) => window.__laAnonimaBranch.setPostalCode(selector, value)",
                     [input_selector, postal_code],
                 )
                 if not set_ok:
@@ -1283,18 +1718,7 @@ class LaAnonimaScraper:
 
             # Select branch via JS (works when radios are hidden) and confirm
             branch_found = self.page.evaluate(
-                """([branchId, confirmSel]) => {
-                    const radio = document.querySelector(
-                        "input[name='sucursalSuper'][value='" + branchId + "']"
-                    );
-                    if (!radio) return false;
-                    radio.checked = true;
-                    radio.dispatchEvent(new Event("change", { bubbles: true }));
-                    const btn = document.querySelector(confirmSel);
-                    if (btn) btn.click();
-                    else if (typeof setSucursalSuper === "function") setSucursalSuper();
-                    return true;
-                }""",
+                "([branchId, confirmSel]) => window.__laAnonimaBranch.selectBranch(branchId, confirmSel)",
                 [branch_id, self._get_selector("confirm_button") or "#btn_setSucursalSuper"],
             )
             if not branch_found:
@@ -1331,11 +1755,10 @@ class LaAnonimaScraper:
                 )
             except Exception:
                 pass
-            # Take screenshot for debugging
+            # Take screenshot for debugging; the PNG is written off the retry path.
             try:
-                screenshot_path = f"data/logs/branch_error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.page.screenshot(path=screenshot_path)
-                logger.info(f"Error screenshot saved to {screenshot_path}")
+                screenshot_path = f"data/logs/branch_error_{time.strftime('%Y%m%d_%H%M%S')}.png"
+                _write_bytes_in_background(Path(screenshot_path), self.page.screenshot(), "Error screenshot")
             except:
                 pass
             debug_html_path = self._save_branch_debug_html()
@@ -1345,29 +1768,26 @@ class LaAnonimaScraper:
                 self._ensure_browser_session()
             raise BranchSelectionError(f"Failed to select branch: {e}")
 
-    def _wait_for_search_settle(self) -> None:
-        """Wait briefly for product cards or empty-search markers."""
+    def _wait_for_search_settle(self, settle_selector: str, timeout_ms: Optional[int] = None) -> None:
+        """Wait briefly for ``settle_selector`` (product cards or empty-search markers).
+
+        If no marker shows up within ``timeout_ms`` after a "commit" navigation,
+        fall back to waiting for DOMContentLoaded so parsing never sees a blank page.
+        """
         if not self.page:
             return
-        markers = [
-            self._get_selector("product_list"),
-            ".producto-item",
-            ".listado .producto-item",
-            ".producto",
-            ".sin-resultado",
-            ".resultado-vacio",
-            "text=No hay productos",
-            "text=No se obtuvieron resultados",
-        ]
-        selector = ", ".join([m for m in markers if m])
         try:
             self.page.wait_for_selector(
-                selector,
-                timeout=max(900, self.quick_selector_timeout_ms * 8),
+                settle_selector,
+                timeout=timeout_ms or max(900, self.quick_selector_timeout_ms * 8),
                 state="attached",
             )
         except Exception:
-            pass
+            if self.search_wait_until == "commit":
+                try:
+                    self.page.wait_for_load_state("domcontentloaded", timeout=self.navigation_timeout)
+                except Exception:
+                    pass
         if self.search_settle_delay_ms > 0:
             self.page.wait_for_timeout(self.search_settle_delay_ms)
     
@@ -1384,7 +1804,19 @@ class LaAnonimaScraper:
             raise RuntimeError("Browser not started")
         
         results = []
-        seen = set()
+        seen: Set[str] = set()
+        card_selectors = self._card_selectors()
+        list_selectors = [
+            selector
+            for selector in dict.fromkeys((
+                self._get_selector("product_list"),
+                ".producto-item",
+                ".listado .producto-item",
+                ".producto",
+            ))
+            if selector
+        ]
+        settle_selector = ", ".join([*list_selectors, *_EMPTY_SEARCH_MARKERS])
         
         for keyword in keywords:
             try:
@@ -1398,7 +1830,7 @@ class LaAnonimaScraper:
                 try:
                     self.page.goto(
                         search_url,
-                        wait_until="domcontentloaded",
+                        wait_until=self.search_wait_until,
                         timeout=self.navigation_timeout,
                     )
                     logger.info(f"Search strategy used: {strategy_used} ({search_url})")
@@ -1422,31 +1854,17 @@ class LaAnonimaScraper:
                     logger.info(f"Search strategy used: {strategy_used}")
                 
                 # Wait briefly for either product cards or empty markers.
-                self._wait_for_search_settle()
+                self._wait_for_search_settle(settle_selector)
                 
-                # Parse results with selector fallback (site changed markup over time)
-                selector_candidates = [
-                    self._get_selector("product_list"),
-                    ".producto-item",
-                    ".listado .producto-item",
-                    ".producto",
-                ]
-                products = []
-                for selector in selector_candidates:
-                    if not selector:
-                        continue
-                    matches = self.page.locator(selector).all()
-                    if matches:
-                        products = matches
-                        break
+                found, parsed_products = self._parse_search_results(list_selectors, card_selectors)
 
-                logger.info(f"Found {len(products)} products for '{keyword}'")
+                logger.info(f"Found {found} products for '{keyword}'")
                 
-                for product in products[: self.max_results_per_search]:
+                for product_data in parsed_products:
                     try:
-                        product_data = self._parse_product(product)
                         if product_data:
-                            key = (product_data.get("url") or "", product_data.get("name") or "")
+                            # Canonical URLs identify products; name only when the card had no link.
+                            key = product_data.get("url") or product_data.get("name") or ""
                             if key in seen:
                                 continue
                             seen.add(key)
@@ -1463,9 +1881,113 @@ class LaAnonimaScraper:
         
         return results
     
-    def _parse_product(self, product_element) -> Optional[Dict[str, Any]]:
-        """Parse a product element into data dictionary."""
+    def _parse_search_results(
+        self,
+        list_selectors: List[str],
+        card_selectors: Dict[str, Any],
+    ) -> Tuple[int, List[Optional[Dict[str, Any]]]]:
+        """Parse the visible result cards, returning (cards matched, parsed products).
+
+        Uses the first list selector that matches anything (site changed markup
+        over time). Selector resolution and card reads happen in a single page
+        evaluate; if that fails, each selector is tried through locators and
+        each card is parsed on its own through _parse_product as a last resort.
+        """
+        limit = self.max_results_per_search
+        try:
+            payload = self.page.evaluate(_SEARCH_RESULTS_JS, [list_selectors, card_selectors, limit])
+        except Exception as e:
+            logger.debug(f"Single-pass result read failed, trying selectors one by one: {e}")
+            payload = None
+        if payload is not None:
+            return self._products_from_card_payload(payload)
+
+        for selector in list_selectors:
+            locator = self.page.locator(selector)
+            try:
+                payload = locator.evaluate_all(_CARD_LIST_FIELDS_JS, [card_selectors, limit])
+            except Exception as e:
+                logger.debug(f"Batch card read failed for '{selector}', parsing per card: {e}")
+                payload = None
+
+            if payload is None:
+                matches = locator.all()
+                if matches:
+                    return len(matches), [
+                        self._parse_product(product, card_selectors)
+                        for product in matches[:limit]
+                    ]
+                continue
+
+            if payload.get("total"):
+                return self._products_from_card_payload(payload)
+
+        return 0, []
+
+    def _products_from_card_payload(
+        self,
+        payload: Dict[str, Any],
+    ) -> Tuple[int, List[Optional[Dict[str, Any]]]]:
+        """Build products from a ``{total, cards}`` batch read of result cards."""
+        products: List[Optional[Dict[str, Any]]] = []
+        for fields in payload.get("cards") or []:
+            try:
+                products.append(
+                    self._product_from_fields(fields, lambda fields=fields: fields.get("card_text"))
+                )
+            except Exception as e:
+                logger.debug(f"Error parsing product element: {e}")
+        return int(payload.get("total") or 0), products
+
+    def _card_selectors(self) -> Dict[str, Any]:
+        """Selector fallbacks for each product card field (site markup changed over time)."""
+        return {
+            "name": [
+                self._get_selector("product_name"),
+                ".titulo",
+                "h2",
+                ".nombre-producto",
+                ".product-name",
+            ],
+            "price": [
+                self._get_selector("product_price"),
+                ".precio",
+                ".precio.plus",
+                ".precio-actual",
+                ".price",
+            ],
+            "old_price": self._get_selector("product_price_old") or ".precio-anterior",
+            "unit_price": self._get_selector("product_unit_price") or ".precio-unitario",
+            "url": [
+                self._get_selector("product_url"),
+                "a[href*='producto']",
+                "a[href*='art_']",
+            ],
+            "out_of_stock": self._get_selector("out_of_stock") or ".sin-stock",
+        }
+
+    def _parse_product(
+        self,
+        product_element,
+        selectors: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a product element into data dictionary.
+
+        ``selectors`` lets callers parsing many cards pass ``_card_selectors()``
+        once instead of rebuilding it per card.
+        """
         try:
+            if selectors is None:
+                selectors = self._card_selectors()
+            # One in-page read of every card field; falls back to per-field locators
+            # when the element can't be evaluated or a selector isn't plain CSS.
+            try:
+                fields = product_element.evaluate(_CARD_FIELDS_JS, selectors)
+            except Exception:
+                fields = None
+            if fields is not None:
+                return self._product_from_fields(fields, lambda: fields.get("card_text"))
+
             def _fast_inner_text(selector: str, timeout_ms: Optional[int] = None) -> Optional[str]:
                 if not selector:
                     return None
@@ -1496,121 +2018,118 @@ class LaAnonimaScraper:
                 except Exception:
                     return None
 
-            def _first_text(selectors: List[str]) -> str:
+            def _first_text(selectors: List[str]) -> Optional[str]:
                 for selector in selectors:
                     text = _fast_inner_text(selector)
                     if text:
                         return text
-                raise ValueError("No selector returned text")
+                return None
 
-            # Product name
-            name = _first_text([
-                self._get_selector("product_name"),
-                ".titulo",
-                "h2",
-                ".nombre-producto",
-                ".product-name",
-            ])
-            
-            # Price
-            price_text = _first_text([
-                self._get_selector("product_price"),
-                ".precio",
-                ".precio.plus",
-                ".precio-actual",
-                ".price",
-            ])
-            price = self._parse_price(price_text)
-            if price is None:
+            def _card_text() -> Optional[str]:
                 try:
-                    try:
-                        raw_card_text = product_element.inner_text(timeout=self.quick_selector_timeout_ms)
-                    except TypeError:
-                        raw_card_text = product_element.inner_text()
-                    price = self._parse_price(raw_card_text)
-                except Exception:
-                    pass
-            
-            # Original price (for discounts)
-            old_price_selector = self._get_selector("product_price_old") or ".precio-anterior"
-            old_price = None
-            old_price_text = _fast_inner_text(old_price_selector, timeout_ms=120)
-            old_price = self._parse_price(old_price_text) if old_price_text else None
-            
-            # Price per unit
-            unit_price_selector = self._get_selector("product_unit_price") or ".precio-unitario"
-            unit_price = None
-            unit_price_text = _fast_inner_text(unit_price_selector, timeout_ms=120)
-            unit_price = self._parse_price(unit_price_text) if unit_price_text else None
-            
-            # URL
-            url = ""
-            url_valid = False
-            for url_selector in [
-                self._get_selector("product_url"),
-                "a[href*='producto']",
-                "a[href*='art_']",
-            ]:
-                raw_url = _fast_attr(url_selector, "href", timeout_ms=150)
-                if raw_url is None:
-                    continue
-                normalized_url = urljoin("https://www.laanonima.com.ar/", raw_url or "")
-                url = self._canonical_product_url(normalized_url)
-                url_valid = self._is_valid_product_url(url)
-                if url:
+                    return product_element.inner_text(timeout=self.quick_selector_timeout_ms)
+                except TypeError:
+                    return product_element.inner_text()
+
+            href = None
+            for url_selector in selectors["url"]:
+                href = _fast_attr(url_selector, "href", timeout_ms=150)
+                if href is not None:
                     break
-            
-            # Stock status
-            in_stock = True
+
+            out_of_stock = False
             try:
-                oos_selector = self._get_selector("out_of_stock") or ".sin-stock"
-                if product_element.locator(oos_selector).count() > 0:
-                    in_stock = False
+                out_of_stock = product_element.locator(selectors["out_of_stock"]).count() > 0
             except:
                 pass
-            
-            # Check for promotion (guard against None price)
-            is_promotion = (
-                old_price is not None and price is not None and old_price > price
-            )
-            presentation = self._parse_presentation_from_name(name)
-            
-            return {
-                "name": name.strip(),
-                "price": price,
-                "original_price": old_price,
-                "price_per_unit": unit_price,
-                "size": (
-                    f"{presentation['presentation_quantity']} {presentation['presentation_unit']}"
-                    if presentation["presentation_quantity"] is not None and presentation["presentation_unit"]
-                    else None
-                ),
-                "presentation_quantity": presentation["presentation_quantity"],
-                "presentation_unit": presentation["presentation_unit"],
-                "url": url,
-                "url_valid": url_valid,
-                "in_stock": in_stock,
-                "is_promotion": is_promotion,
+
+            fields = {
+                "name": _first_text(selectors["name"]),
+                "price": _first_text(selectors["price"]),
+                # Optional fields are usually absent; the card is already rendered, so
+                # a short bound keeps a miss from stalling the card.
+                "old_price": _fast_inner_text(selectors["old_price"], timeout_ms=50),
+                "unit_price": _fast_inner_text(selectors["unit_price"], timeout_ms=50),
+                "href": href,
+                "out_of_stock": out_of_stock,
             }
-            
+            return self._product_from_fields(fields, _card_text)
+
         except Exception as e:
             logger.debug(f"Error parsing product element: {e}")
             return None
-    
+
+    def _product_from_fields(
+        self,
+        fields: Dict[str, Any],
+        card_text: Callable[[], Optional[str]],
+    ) -> Dict[str, Any]:
+        """Build the product dict from raw card texts; ``card_text`` is read only as a price fallback."""
+        name = fields.get("name")
+        price_text = fields.get("price")
+        if not name or not price_text:
+            raise ValueError("No selector returned text")
+
+        price = self._parse_price(price_text)
+        if price is None:
+            try:
+                price = self._parse_price(card_text())
+            except Exception:
+                pass
+
+        old_price_text = fields.get("old_price")
+        old_price = self._parse_price(old_price_text) if old_price_text else None
+        unit_price_text = fields.get("unit_price")
+        unit_price = self._parse_price(unit_price_text) if unit_price_text else None
+
+        url = ""
+        url_valid = False
+        href = fields.get("href")
+        if href is not None:
+            url = self._canonical_product_url(self._absolute_product_url(href or ""))
+            url_valid = self._is_valid_product_url(url)
+
+        in_stock = not fields.get("out_of_stock")
+
+        # Check for promotion (guard against None price)
+        is_promotion = (
+            old_price is not None and price is not None and old_price > price
+        )
+        presentation_quantity, presentation_unit = self._parse_presentation_from_name(name)
+
+        return {
+            "name": name.strip(),
+            "_name_lower": name.strip().lower(),
+            "price": price,
+            "original_price": old_price,
+            "price_per_unit": unit_price,
+            "size": (
+                f"{presentation_quantity} {presentation_unit}"
+                if presentation_quantity is not None and presentation_unit
+                else None
+            ),
+            "presentation_quantity": presentation_quantity,
+            "presentation_unit": presentation_unit,
+            "url": url,
+            "url_valid": url_valid,
+            "in_stock": in_stock,
+            "is_promotion": is_promotion,
+        }
+
     def _parse_price(self, price_text: str) -> Optional[Decimal]:
         """Parse price text to Decimal."""
         if not price_text:
             return None
+        # Placeholders like "—" or "Sin stock" can never yield a price.
+        if not any(ch.isdigit() for ch in price_text):
+            return None
         
-        # Remove currency symbols, dots (thousand separator), and whitespace
-        # Argentine format: $ 1.234,56 or $1234,56
-        cleaned = price_text.replace("$", "").replace(".", "").replace(" ", "").strip()
-        
-        # Replace comma with dot for decimal
-        cleaned = cleaned.replace(",", ".")
+        # Remove currency symbols, dots (thousand separator), and spaces, and turn
+        # the decimal comma into a dot in one pass. Argentine format: $ 1.234,56 or $1234,56
+        cleaned = price_text.translate(_PRICE_TRANSLATION).strip()
         
         # Extract numeric part
-        match = re.search(r'[\d.]+', cleaned)
+        match = _PRICE_NUMBER_RE.search(cleaned)
         if match:
             try:
                 return Decimal(match.group())
@@ -1640,8 +2159,8 @@ class LaAnonimaScraper:
         best_score = 0.0
         best_tie_break = (-1, -1, -1)
         
-        for product in search_results:
-            score, breakdown, tie_break = self._score_product_match(product, basket_item)
+        scores = self._score_products(search_results, basket_item)
+        for product, (score, breakdown, tie_break) in zip(search_results, scores):
             logger.debug(
                 "Match candidate '{}': score={:.4f} tie_break={} breakdown={}",
                 product.get("name", "<sin nombre>"),
@@ -1682,8 +2201,8 @@ class LaAnonimaScraper:
         scored: List[Dict[str, Any]] = []
         seen_identities: Set[Tuple[str, str]] = set()
         scored_identities: Set[Tuple[str, str]] = set()
-        for product in search_results:
-            score, _breakdown, tie_break = self._score_product_match(product, basket_item)
+        scores = self._score_products(search_results, basket_item)
+        for product, (score, _breakdown, tie_break) in zip(search_results, scores):
             price = product.get("price")
             if score <= 0 or price is None:
                 continue
@@ -1704,18 +2223,27 @@ class LaAnonimaScraper:
                 }
             )
 
+        # Sort keys are computed once per row; the row is kept alongside its
+        # key so the id() cannot be reused while the cache is alive.
+        sort_key_cache: Dict[int, Tuple[Dict[str, Any], Tuple[float, float, float, str]]] = {}
+
         def _sort_key(row: Dict[str, Any]) -> Tuple[float, float, float, str]:
+            cached = sort_key_cache.get(id(row))
+            if cached is not None:
+                return cached[1]
             normalized_price = self._candidate_sort_price(row)
             try:
                 absolute_price = float(row.get("product", {}).get("price"))
             except (TypeError, ValueError):
                 absolute_price = float("inf")
-            return (
+            key = (
                 normalized_price,
                 absolute_price,
                 -float(row.get("confidence") or 0.0),
                 str(row.get("product", {}).get("name") or ""),
             )
+            sort_key_cache[id(row)] = (row, key)
+            return key
 
         fallback_pool: List[Dict[str, Any]] = []
         for product in search_results:
@@ -1728,7 +2256,7 @@ class LaAnonimaScraper:
             semantic_ok, _semantic_debug = self._passes_semantic_guard(product, basket_item)
             if not semantic_ok:
                 continue
-            product_name = str(product.get("name") or "").lower()
+            product_name = self._product_name_lower(product)
             if keywords and not any(keyword in product_name for keyword in keywords):
                 continue
             seen_identities.add(identity)
@@ -1798,7 +2326,8 @@ class LaAnonimaScraper:
                     ),
                 )
                 selected_pool = list(grouped_by_presentation.get(ranked_groups[0][0], []))
-            selected_pool.sort(key=_sort_key)
+            # Every pool above is filtered from ``scored`` in order, so it is
+            # already sorted and does not need a second pass.
 
         if not selected_pool:
             return [], None
@@ -1846,17 +2375,12 @@ class LaAnonimaScraper:
             return [], None
 
         selected.sort(key=_sort_key)
-        for idx, row in enumerate(selected):
-            if len(selected) == 1:
-                row["tier"] = "single"
-            elif idx == 0:
-                row["tier"] = "low"
-            elif idx == len(selected) - 1:
-                row["tier"] = "high"
-            elif idx == len(selected) // 2:
-                row["tier"] = "mid"
-            else:
-                row["tier"] = "mid"
+        if len(selected) == 1:
+            tiers = ["single"]
+        else:
+            tiers = ["low"] + ["mid"] * (len(selected) - 2) + ["high"]
+        for row, tier in zip(selected, tiers):
+            row["tier"] = tier
 
         representative = next((row for row in selected if row.get("tier") == "mid"), selected[len(selected) // 2])
         return selected, representative
@@ -1880,15 +2404,19 @@ class LaAnonimaScraper:
         if not search_results:
             return None, 0.0, "list_match"
 
-        ranked = sorted(
+        # Only the two best candidates are ever opened, so take the top 2 directly.
+        ranked = heapq.nlargest(
+            2,
             (
-                (product, *self._score_product_match(product, basket_item))
-                for product in search_results
+                (product, *scored)
+                for product, scored in zip(
+                    search_results,
+                    self._score_products(search_results, basket_item),
+                )
+                if scored[0] > 0
             ),
             key=lambda item: (item[1], item[3]),
-            reverse=True,
         )
-        ranked = [item for item in ranked if item[1] > 0]
         if not ranked:
             return None, 0.0, "list_match"
 
@@ -1896,39 +2424,58 @@ class LaAnonimaScraper:
         list_candidate, list_confidence, _, _ = ranked[0]
         list_method = "list_match"
 
-        def _first_text(selectors: List[str]) -> Optional[str]:
+        def _first_text(page: Page, selectors: List[str]) -> Optional[str]:
             for selector in selectors:
                 try:
-                    locator = self.page.locator(selector).first
-                    if locator.count() > 0 and locator.is_visible(timeout=1500):
-                        text = locator.inner_text().strip()
-                        if text:
-                            return text
+                    # count() and is_visible() do not wait, so misses cost one round-trip;
+                    # only a matched node gets the short inner_text timeout.
+                    locator = page.locator(selector).first
+                    if locator.count() == 0 or not locator.is_visible():
+                        continue
+                    text = locator.inner_text(timeout=self.quick_selector_timeout_ms).strip()
                 except Exception:
                     continue
+                if text:
+                    return text
             return None
 
         def _open_and_extract_detail(product: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             product_url = product.get("url")
             opened = False
+            page = self.page
 
             if product_url:
                 try:
-                    self.page.goto(product_url, wait_until="domcontentloaded", timeout=self.navigation_timeout)
+                    page = self._get_detail_page()
+                    page.goto(product_url, wait_until="domcontentloaded", timeout=self.navigation_timeout)
                     opened = True
                 except Exception as nav_error:
                     logger.warning(f"Failed opening product URL '{product_url}': {nav_error}")
 
             if not opened:
+                # The click fallback needs the search results, which live on the main page.
+                page = self.page
                 try:
-                    product_name = product.get("name", "")
-                    safe_name = product_name.replace("'", "\\'")
-                    click_selector = (
-                        f".producto:has-text('{safe_name}') a[href*='art_'], "
-                        f".producto:has-text('{safe_name}') a[href*='producto']"
-                    )
-                    self.page.locator(click_selector).first.click(timeout=5000)
-                    self.page.wait_for_load_state("domcontentloaded", timeout=self.navigation_timeout)
+                    product_path = urlsplit(product_url).path if product_url else ""
+                    if product_path and product_path != "/":
+                        # Attribute lookup on the known link inside a result card; avoids a
+                        # text match over every card. The path must end the href (or be
+                        # followed by a query/fragment) so art_123 never matches art_1234.
+                        safe_path = product_path.replace("'", "\\'")
+                        click_selector = ", ".join(
+                            f"{card} a[href{match}]"
+                            for card in (".producto", ".producto-item")
+                            for match in (f"$='{safe_path}'", f"*='{safe_path}?'", f"*='{safe_path}#'")
+                        )
+                    else:
+                        product_name = product.get("name", "")
+                        safe_name = product_name.replace("'", "\\'")
+                        click_selector = (
+                            f".producto:has-text('{safe_name}') a[href*='art_'], "
+                            f".producto:has-text('{safe_name}') a[href*='producto']"
+                        )
+                    page.locator(click_selector).first.click(timeout=5000)
+                    page.wait_for_load_state("domcontentloaded", timeout=self.navigation_timeout)
                     opened = True
                 except Exception as click_error:
                     logger.warning(f"Failed opening product by click '{product.get('name')}': {click_error}")
@@ -1937,7 +2484,7 @@ class LaAnonimaScraper:
                 return None
 
             try:
-                self.page.wait_for_selector(
+                page.wait_for_selector(
                     ", ".join([
                         ".ficha-producto",
                         ".detalle-producto",
@@ -1950,24 +2497,17 @@ class LaAnonimaScraper:
             except Exception:
                 pass
 
-            detail_name = _first_text([
-                "h1.nombre-producto",
-                ".detalle-producto h1",
-                "h1[itemprop='name']",
-                ".ficha-producto .nombre-producto",
-            ])
-            detail_price_text = _first_text([
-                ".detalle-producto .precio-actual",
-                ".ficha-producto .precio-actual",
-                ".contenedor-precios .precio-actual",
-                "[itemprop='price']",
-            ])
-            detail_unit_price_text = _first_text([
-                ".detalle-producto .precio-unitario",
-                ".ficha-producto .precio-unitario",
-                ".contenedor-precios .precio-unitario",
-                ".precio-por-unidad",
-            ])
+            # All detail texts in one round-trip; per-selector locators only if that fails.
+            try:
+                detail_texts = page.evaluate(_DETAIL_TEXTS_JS, _DETAIL_TEXT_SELECTORS)
+            except Exception:
+                detail_texts = {
+                    field: _first_text(page, selectors)
+                    for field, selectors in _DETAIL_TEXT_SELECTORS.items()
+                }
+            detail_name = detail_texts.get("name")
+            detail_price_text = detail_texts.get("price")
+            detail_unit_price_text = detail_texts.get("unit_price")
 
             detail_price = self._parse_price(detail_price_text) if detail_price_text else None
             detail_unit_price = self._parse_price(detail_unit_price_text) if detail_unit_price_text else None
@@ -1984,7 +2524,7 @@ class LaAnonimaScraper:
             in_stock = True
             for selector in detail_oos_selectors:
                 try:
-                    if self.page.locator(selector).count() > 0:
+                    if page.locator(selector).count() > 0:
                         in_stock = False
                         break
                 except Exception:
@@ -1992,10 +2532,11 @@ class LaAnonimaScraper:
 
             verified = dict(product)
             verified["name"] = (detail_name or product.get("name", "")).strip()
+            verified["_name_lower"] = verified["name"].lower()
             verified["price"] = detail_price
             verified["price_per_unit"] = detail_unit_price
             verified["in_stock"] = in_stock
-            verified_url = self._canonical_product_url(self.page.url or product_url)
+            verified_url = self._canonical_product_url(page.url or product_url)
             verified["url"] = verified_url
             verified["url_valid"] = self._is_valid_product_url(verified_url)
 
@@ -2016,10 +2557,16 @@ class LaAnonimaScraper:
 def _save_candidate_audit_json(run_uuid: str, records: List[Dict[str, Any]]) -> Optional[str]:
     if not records:
         return None
-    out_dir = Path("data/analysis/scrape_audits")
+    out_dir = CANDIDATE_AUDIT_DIR
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"candidates_{run_uuid}.json"
-    out_path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8")
+    # ``indent`` forces the pure-Python encoder; compact output stays on the C
+    # encoder and is only pretty-printed when debug logging is enabled.
+    if _debug_logging_enabled():
+        payload = json.dumps(records, ensure_ascii=False, indent=2)
+    else:
+        payload = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+    out_path.write_text(payload, encoding="utf-8")
     return str(out_path)
 
 
@@ -2300,6 +2847,7 @@ def run_scrape(
                 items_since_commit = 0
 
         with LaAnonimaScraper(config, headless=headless) as scraper:
+            scraper.prepare_basket_items(planned_items)
             logger.info("Selecting branch...")
             scraper._branch_attempt = 0
             branch_success = scraper.select_branch()
@@ -9,12 +9,12 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
 from src.config_loader import load_config
-from src.reporting import run_report
+from src.reporting import PRODUCT_DETAILS_FILENAME, run_report
 from src.web_styles import (
     get_shell_css_bundle,
     get_shell_css_version,
@@ -26,6 +26,7 @@ _REPORT_METADATA_RE = re.compile(r"report_interactive_(\d{6})_to_(\d{6})_(\d{8}_
 _MONTH_RE = re.compile(r"^\d{4}-\d{2}$")
 _TRACKER_CSS_REF_RE = re.compile(r"""href=["'](?:\./)?tracker-ui\.css(?:\?[^"'<>]*)?["']""", re.IGNORECASE)
 _HEAD_CLOSE_RE = re.compile(r"</head>", re.IGNORECASE)
+_UNSAFE_ID_CHARS_RE = re.compile(r"[^\w-]")
 _PUBLICATION_POLICY = "publish_with_alert_on_partial"
 _PUBLICATION_POLICY_SUMMARY = "Se publica con alerta si falta cobertura o IPC."
 _SITE_TITLE = "Tracker de precios: La Anónima Ushuaia"
@@ -529,7 +530,7 @@ class StaticWebPublisher:
             tracker_css_path.write_text(get_tracker_css_bundle(), encoding="utf-8")
         shutil.copy2(latest.metadata_path, latest_meta_path)
 
-        # Also copy per-product JSON files so build_product_detail_pages() can read them.
+        # Also copy per-product detail records so build_product_detail_pages() can read them.
         source_products_dir = latest.html_path.parent / "products"
         dest_products_dir = tracker_dir / "products"
         if source_products_dir.exists():
@@ -1245,6 +1246,34 @@ class StaticWebPublisher:
             next_update_eta=str(manifest.get("next_update_eta") or ""),
         )
 
+    @staticmethod
+    def _iter_product_details(products_dir: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (fallback_id, record) pairs from the reporting product details.
+
+        Reads the single JSON Lines file written by reporting.py; reports from
+        older runs that wrote one ``{id}.json`` per product are still supported.
+        """
+        details_path = products_dir / PRODUCT_DETAILS_FILENAME
+        if details_path.exists():
+            with details_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict):
+                        yield "", record
+            return
+        for json_file in sorted(products_dir.glob("*.json")):
+            try:
+                record = json.loads(json_file.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            if isinstance(record, dict):
+                yield json_file.stem, record
+
     def build_product_detail_pages(self, copied: Dict[str, str], manifest: Dict[str, Any]) -> None:
         """Generate one /tracker/{canonical_id}/index.html per product."""
         tracker_path = Path(copied["tracker_path"])
@@ -1314,13 +1343,8 @@ class StaticWebPublisher:
                 f"</tr>"
             )
 
-        for json_file in sorted(products_source_dir.glob("*.json")):
-            try:
-                pd_data = json.loads(json_file.read_text(encoding="utf-8"))
-            except Exception:
-                continue
-
-            canonical_id = str(pd_data.get("canonical_id") or json_file.stem)
+        for fallback_id, pd_data in self._iter_product_details(products_source_dir):
+            canonical_id = str(pd_data.get("canonical_id") or fallback_id)
             product_name = str(pd_data.get("product_name") or canonical_id)
             category = str(pd_data.get("category") or "").replace("_", " ").title()
             presentation = str(pd_data.get("presentation") or "")
@@ -1493,7 +1517,7 @@ class StaticWebPublisher:
 </html>"""
 
             # Write to public/tracker/{canonical_id}/index.html
-            safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in canonical_id)
+            safe_id = _UNSAFE_ID_CHARS_RE.sub("_", canonical_id)
             detail_dir = self.output_dir / "tracker" / safe_id
             detail_dir.mkdir(parents=True, exist_ok=True)
             (detail_dir / "index.html").write_text(page_html, encoding="utf-8")
@@ -1,16 +1,21 @@
 """API and repository integration tests."""
 
+import base64
+import json
 import sys
 import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.api import app, get_session
+from sqlalchemy import func, select
+
+from src.api import _resolve_count_mode, app, get_session
 from src.models import (
     CategoryIndex,
     IPCPublicationRun,
@@ -25,6 +30,7 @@ from src.models import (
     get_session_factory,
     init_db,
 )
+from src.repositories import SeriesRepository
 
 
 class TestAPI(unittest.TestCase):
@@ -292,6 +298,192 @@ class TestAPI(unittest.TestCase):
         self.assertIsNotNone(payload["item"])
         self.assertEqual(payload["item"]["status"], "completed")
 
+    def test_latest_publication_source_projection(self):
+        repository = SeriesRepository(self.session)
+        full = repository.get_latest_ipc_publication_status(basket_type="all", region="patagonia")
+        source = repository.get_latest_ipc_publication_source(basket_type="all", region="patagonia")
+
+        self.assertEqual(set(source), {"official_source", "metrics_json"})
+        self.assertEqual(source["official_source"], full["official_source"])
+        self.assertEqual(source["metrics_json"], full["metrics_json"])
+        self.assertIsNone(repository.get_latest_ipc_publication_source(region="sin_datos"))
+
+    def _seed_paging_rows(self):
+        """Extra rows so listings span several pages, with scraped_at ties."""
+        leche = self.session.query(Product).filter_by(canonical_id="prod_1").one()
+        run = self.session.query(ScrapeRun).filter_by(run_uuid="run-1").one()
+        for idx in range(8):
+            self.session.add(
+                Price(
+                    product_id=leche.id,
+                    run_id=run.id,
+                    canonical_id="prod_1",
+                    basket_id="cba",
+                    product_name="Leche",
+                    current_price=200 + idx,
+                    scraped_at=datetime(2024, 2, 1 + idx // 2, 9, 0, 0),
+                )
+            )
+        for month in ("2024-02", "2024-03", "2024-04"):
+            for category in ("almacen", "lacteos"):
+                self.session.add(
+                    CategoryIndex(
+                        basket_type="cba",
+                        category=category,
+                        year_month=month,
+                        index_value=100,
+                        products_included=1,
+                        products_missing=0,
+                    )
+                )
+        self.session.commit()
+
+    def _walk_cursor(self, path, params):
+        items = []
+        cursor = ""
+        for _ in range(50):
+            response = self.client.get(path, params={**params, "page_size": 3, "cursor": cursor})
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            pagination = payload["pagination"]
+            self.assertIsNone(pagination["page"])
+            self.assertIsNone(pagination["total"])
+            self.assertIsNone(pagination["total_pages"])
+            self.assertLessEqual(len(payload["items"]), 3)
+            items.extend(payload["items"])
+            if not pagination["has_more"]:
+                self.assertIsNone(pagination["next_cursor"])
+                return items
+            self.assertEqual(len(payload["items"]), 3)
+            cursor = pagination["next_cursor"]
+        self.fail(f"cursor walk over {path} did not terminate")
+
+    def _assert_cursor_walk_matches_listing(self, path, params, key):
+        self._seed_paging_rows()
+        walked = [key(item) for item in self._walk_cursor(path, params)]
+        listing = self.client.get(path, params={**params, "page_size": 500}).json()
+        expected = [key(item) for item in listing["items"]]
+        self.assertGreater(len(expected), 3)
+        self.assertEqual(len(walked), len(set(walked)))
+        self.assertEqual(sorted(walked), sorted(expected))
+
+    def test_series_producto_cursor_walk_returns_every_row_once(self):
+        self._assert_cursor_walk_matches_listing(
+            "/series/producto",
+            {},
+            lambda item: (item["canonical_id"], item["scraped_at"], item["current_price"]),
+        )
+
+    def test_series_categoria_cursor_walk_returns_every_row_once(self):
+        self._assert_cursor_walk_matches_listing(
+            "/series/categoria",
+            {"category": "lacteos"},
+            lambda item: (item["canonical_id"], item["scraped_at"], item["current_price"]),
+        )
+
+    def test_ipc_categorias_cursor_walk_returns_every_row_once(self):
+        self._assert_cursor_walk_matches_listing(
+            "/ipc/categorias",
+            {},
+            lambda item: (item["basket_type"], item["category"], item["year_month"]),
+        )
+
+    def test_invalid_cursor_returns_400(self):
+        def encode(values):
+            return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+        cases = [
+            ("/series/producto", {}, ["2024-01-01T09:00:00", {"a": 1}, 1]),
+            ("/series/categoria", {"category": "lacteos"}, ["2024-01-01T09:00:00", "prod_1", "1"]),
+            ("/ipc/categorias", {}, ["2024-01", 5, 1]),
+        ]
+        for path, params, wrong_types in cases:
+            for cursor in ("not-a-cursor", encode({"a": 1}), encode(["2024-01-01"]), encode(wrong_types)):
+                with self.subTest(path=path, cursor=cursor):
+                    response = self.client.get(path, params={**params, "cursor": cursor})
+                    self.assertEqual(response.status_code, 400)
+
+    def test_pagination_shape_per_count_mode(self):
+        self._seed_paging_rows()
+        exact_shape = {
+            "page": 2,
+            "page_size": 3,
+            "total": 10,
+            "total_pages": 4,
+            "next_cursor": None,
+            "has_more": True,
+        }
+        expected = {
+            "exact": exact_shape,
+            # SQLite has no planner estimate, so "estimate" falls back to exact.
+            "estimate": exact_shape,
+            "none": {
+                "page": 2,
+                "page_size": 3,
+                "total": None,
+                "total_pages": None,
+                "next_cursor": None,
+                "has_more": True,
+            },
+        }
+        for mode, shape in expected.items():
+            with self.subTest(mode=mode), patch("src.api._COUNT_MODE", mode):
+                response = self.client.get("/series/producto", params={"page": 2, "page_size": 3})
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["pagination"], shape)
+
+        cursor_page = self.client.get("/series/producto", params={"page_size": 3, "cursor": ""}).json()
+        self.assertEqual(
+            set(cursor_page["pagination"]),
+            {"page", "page_size", "total", "total_pages", "next_cursor", "has_more"},
+        )
+        self.assertTrue(cursor_page["pagination"]["has_more"])
+        self.assertIsInstance(cursor_page["pagination"]["next_cursor"], str)
+
+    def test_count_mode_falls_back_to_exact_when_invalid(self):
+        self.assertEqual(_resolve_count_mode(" estimate "), "estimate")
+        self.assertEqual(_resolve_count_mode(None), "exact")
+        self.assertEqual(_resolve_count_mode("approximate"), "exact")
+
+    def test_repository_none_count_mode_skips_totals(self):
+        repository = SeriesRepository(self.session, count_mode="none")
+        rows, pagination = repository.get_product_series(page=1, page_size=1)
+        self.assertEqual(len(rows), 1)
+        self.assertIsNone(pagination.total)
+        self.assertIsNone(pagination.total_pages)
+        self.assertTrue(pagination.has_more)
+
+        rows, pagination = repository.get_product_series(page=2, page_size=1)
+        self.assertEqual(len(rows), 1)
+        self.assertIsNone(pagination.total)
+        self.assertFalse(pagination.has_more)
+
+    def test_repository_estimate_count_mode_uses_planner_rows(self):
+        repository = SeriesRepository(self.session, count_mode="estimate")
+        dialect = self.session.get_bind().dialect
+        with patch.object(dialect, "name", "postgresql"), patch.object(
+            SeriesRepository, "_estimate_count", return_value=50
+        ) as estimate:
+            _rows, pagination = repository.get_product_series(page=1, page_size=1)
+            self.assertEqual(pagination.total, 50)
+            self.assertTrue(pagination.has_more)
+
+            # The last page knows its exact total without asking the planner.
+            _rows, pagination = repository.get_product_series(page=2, page_size=1)
+            self.assertEqual(pagination.total, 2)
+            self.assertFalse(pagination.has_more)
+        estimate.assert_called_once()
+
+    def test_repository_failed_estimate_keeps_session_usable(self):
+        repository = SeriesRepository(self.session, count_mode="estimate")
+        # SQLite rejects EXPLAIN (FORMAT JSON); only the savepoint is rolled back.
+        with patch.object(self.session, "begin_nested", wraps=self.session.begin_nested) as savepoint:
+            self.assertIsNone(repository._estimate_count(select(Price.id)))
+        savepoint.assert_called_once()
+        self.assertEqual(self.session.execute(select(func.count(Price.id))).scalar_one(), 2)
+        rows, _pagination = repository.get_product_series(page=1, page_size=5)
+        self.assertEqual(len(rows), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
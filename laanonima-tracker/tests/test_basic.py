@@ -2,6 +2,7 @@
 
 import os
 import sys
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +23,17 @@ from src.models import (
 from src.category_backfill import backfill_canonical_categories, validate_price_category_traceability
 
 
+def _config_with_temp_sqlite(test_case: unittest.TestCase) -> dict:
+    """Loaded config whose SQLite database lives in a per-test temp directory."""
+    tmp_dir = tempfile.TemporaryDirectory()
+    test_case.addCleanup(tmp_dir.cleanup)
+    config = load_config()
+    config.setdefault("storage", {}).setdefault("sqlite", {})["database_path"] = str(
+        Path(tmp_dir.name) / "laanonima_prices.db"
+    )
+    return config
+
+
 class TestConfig(unittest.TestCase):
     """Test configuration loading."""
     
@@ -60,19 +72,50 @@ class TestDatabase(unittest.TestCase):
     
     def test_engine_creation(self):
         """Test database engine creation."""
-        config = load_config()
+        config = _config_with_temp_sqlite(self)
         engine = get_engine(config, "sqlite")
+        self.addCleanup(engine.dispose)
         self.assertIsNotNone(engine)
     
     def test_init_db(self):
         """Test database initialization."""
-        config = load_config()
+        config = _config_with_temp_sqlite(self)
         engine = get_engine(config, "sqlite")
+        self.addCleanup(engine.dispose)
         
         # Should not raise
         init_db(engine)
 
 
+class TestCategoryNormalization(unittest.TestCase):
+    """Test the startup normalization of legacy product categories."""
+
+    def test_init_db_lowercases_legacy_categories_only_when_needed(self):
+        from sqlalchemy import event, text
+
+        engine = get_engine({"storage": {"default_backend": "sqlite", "sqlite": {"database_path": ":memory:"}}}, "sqlite")
+        init_db(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO products (canonical_id, basket_id, name, category) "
+                    "VALUES ('prod_1', 'cba', 'Leche', ' Lacteos ')"
+                )
+            )
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        init_db(engine)
+        with engine.connect() as conn:
+            category = conn.execute(text("SELECT category FROM products")).scalar()
+        self.assertEqual(category, "lacteos")
+        self.assertTrue(any(sql.startswith("UPDATE products") for sql in statements))
+
+        statements.clear()
+        init_db(engine)
+        self.assertFalse(any(sql.startswith("UPDATE products") for sql in statements))
+
+
 class TestModels(unittest.TestCase):
     """Test data models."""
     
@@ -123,7 +166,7 @@ class TestAnalysis(unittest.TestCase):
         """Test BasketAnalyzer initialization."""
         from src.analysis import BasketAnalyzer
         
-        config = load_config()
+        config = _config_with_temp_sqlite(self)
         analyzer = BasketAnalyzer(config)
         self.assertIsNotNone(analyzer)
         analyzer.close()
@@ -16,8 +16,10 @@ class TestInteractiveReport(unittest.TestCase):
     def setUp(self):
         self.tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
         self.tmp.close()
+        self.reports_dir = tempfile.TemporaryDirectory()
         self.config = {
             "storage": {"default_backend": "sqlite", "sqlite": {"database_path": self.tmp.name}},
+            "analysis": {"reports_dir": self.reports_dir.name},
             "baskets": {
                 "cba": {"items": [{"id": "prod_1", "category": "lacteos"}]},
                 "extended": {"items": [{"id": "prod_2", "category": "bebidas"}]},
@@ -32,6 +34,7 @@ class TestInteractiveReport(unittest.TestCase):
         self.session.close()
         self.generator.close()
         self.engine.dispose()
+        self.reports_dir.cleanup()
         try:
             Path(self.tmp.name).unlink(missing_ok=True)
         except PermissionError:
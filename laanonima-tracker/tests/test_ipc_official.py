@@ -53,6 +53,11 @@ class TestOfficialIPCSync(unittest.TestCase):
             },
         }
 
+        self.raw_dir = tempfile.TemporaryDirectory()
+        raw_dir_patch = patch("src.ipc_official.RAW_SNAPSHOT_DIR", Path(self.raw_dir.name))
+        raw_dir_patch.start()
+        self.addCleanup(raw_dir_patch.stop)
+
         self.engine = get_engine(self.config, "sqlite")
         init_db(self.engine)
         self.session = get_session_factory(self.engine)()
@@ -60,6 +65,7 @@ class TestOfficialIPCSync(unittest.TestCase):
     def tearDown(self):
         self.session.close()
         self.engine.dispose()
+        self.raw_dir.cleanup()
         Path(self.tmp_db.name).unlink(missing_ok=True)
         Path(self.tmp_csv.name).unlink(missing_ok=True)
 
@@ -1,6 +1,8 @@
 """Tests for reporting date-range boundaries."""
 
+import json
 import sys
+import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -244,6 +246,31 @@ class TestReportMonthlyRange(unittest.TestCase):
         self.assertEqual(status.get("latest_tracker_month"), "2026-02")
         self.assertEqual(status.get("latest_official_month"), "2026-01")
 
+    def test_product_details_skip_unserializable_product(self):
+        payload = {
+            "to_month": "2024-02",
+            "generated_at": "2024-02-29 12:00:00 UTC",
+            "snapshot": [
+                {"canonical_id": "prod_bad", "current_price": object()},
+                {"canonical_id": "prod/ok", "product_name": "Leche", "current_price": 110.0},
+            ],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            products_dir = Path(tmp) / "products"
+            self.generator._write_product_details(products_dir, payload, payload)
+
+            lines = (products_dir / "products.jsonl").read_text(encoding="utf-8").splitlines()
+            self.assertEqual(len(lines), 1)
+            data = json.loads(lines[0])
+            self.assertEqual(data["canonical_id"], "prod/ok")
+
+    def test_product_details_skip_empty_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            products_dir = Path(tmp) / "products"
+            self.generator._write_product_details(products_dir, {"snapshot": []}, {})
+
+            self.assertFalse(products_dir.exists())
+
 
 
 if __name__ == "__main__":
@@ -15,8 +15,10 @@ class TestReportingAdsSlots(unittest.TestCase):
     def setUp(self):
         self.tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
         self.tmp.close()
+        self.reports_dir = tempfile.TemporaryDirectory()
         self.config = {
             "storage": {"default_backend": "sqlite", "sqlite": {"database_path": self.tmp.name}},
+            "analysis": {"reports_dir": self.reports_dir.name},
             "baskets": {
                 "cba": {"items": []},
                 "extended": {"items": []},
@@ -55,6 +57,7 @@ class TestReportingAdsSlots(unittest.TestCase):
         self.session.close()
         self.generator.close()
         self.engine.dispose()
+        self.reports_dir.cleanup()
         try:
             Path(self.tmp.name).unlink(missing_ok=True)
         except PermissionError:
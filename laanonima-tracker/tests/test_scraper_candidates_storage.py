@@ -30,6 +30,9 @@ class FakeScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         return False
 
+    def prepare_basket_items(self, _items):
+        return None
+
     def select_branch(self):
         return True
 
@@ -89,6 +92,9 @@ class FakeFailingScraper:
     def __exit__(self, exc_type, exc_val, exc_tb):
         return False
 
+    def prepare_basket_items(self, _items):
+        return None
+
     def select_branch(self):
         return True
 
@@ -110,6 +116,9 @@ class TestScraperCandidateStorage(unittest.TestCase):
     def setUp(self):
         self.tmpdir = tempfile.TemporaryDirectory()
         self.db_path = str(Path(self.tmpdir.name) / "prices.db")
+        audit_dir_patch = patch("src.scraper.CANDIDATE_AUDIT_DIR", Path(self.tmpdir.name) / "scrape_audits")
+        audit_dir_patch.start()
+        self.addCleanup(audit_dir_patch.stop)
         self.config = {
             "branch": {"postal_code": "9410", "branch_name": "USHUAIA", "branch_id": "75"},
             "website": {"timeout": 1000, "retry_attempts": 1},
@@ -4,7 +4,8 @@ import sys
 import unittest
 from decimal import Decimal
 from pathlib import Path
-from urllib.parse import quote
+from unittest.mock import MagicMock, patch
+from urllib.parse import quote, urljoin, urlsplit, urlunsplit
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -55,6 +56,39 @@ class FakeProductElement:
         return value
 
 
+class FakeListLocator:
+    """Result-list locator whose batch read fails, forcing per-card parsing."""
+
+    def __init__(self, elements):
+        self._elements = elements
+
+    def evaluate_all(self, _script, _arg):
+        raise RuntimeError("evaluate_all not available")
+
+    def all(self):
+        return list(self._elements)
+
+
+class FakeSearchPage:
+    """Search page double: ``evaluate`` serves the batched card payload when given cards."""
+
+    def __init__(self, cards=None, elements=None, list_selector=None):
+        self._cards = cards
+        self._elements = elements or []
+        self._list_selector = list_selector
+        self.evaluate_calls = 0
+
+    def evaluate(self, _script, arg):
+        self.evaluate_calls += 1
+        if self._cards is None:
+            raise RuntimeError("evaluate not available")
+        _list_selectors, _card_selectors, limit = arg
+        return {"total": len(self._cards), "cards": self._cards[:limit]}
+
+    def locator(self, selector):
+        return FakeListLocator(self._elements if selector == self._list_selector else [])
+
+
 class TestScraperContract(unittest.TestCase):
     """Contract-level unit tests for scraper internals."""
 
@@ -81,6 +115,101 @@ class TestScraperContract(unittest.TestCase):
         parsed = self.scraper._parse_price("$ 1.234,56")
         self.assertEqual(parsed, Decimal("1234.56"))
 
+    def test_search_settle_selector_follows_current_product_list_selector(self):
+        self.scraper.page = MagicMock()
+        self.scraper.selectors["product_list"] = ".grilla-nueva .card"
+
+        with patch.object(self.scraper, "_wait_for_search_settle") as settle, patch.object(
+            self.scraper, "_parse_search_results", return_value=(0, [])
+        ) as parse:
+            self.scraper.search_product(["yerba"])
+
+        list_selectors = parse.call_args.args[0]
+        settle_selector = settle.call_args.args[0]
+        self.assertEqual(list_selectors[0], ".grilla-nueva .card")
+        self.assertTrue(settle_selector.startswith(".grilla-nueva .card, "))
+        self.assertIn(".sin-resultado", settle_selector)
+
+    def test_parse_price_edge_cases(self):
+        cases = [
+            ("$ 1.234,56", Decimal("1234.56")),
+            ("$1234,56", Decimal("1234.56")),
+            ("$ 99", Decimal("99")),
+            ("1.234", Decimal("1234")),
+            ("1,5 kg", Decimal("1.5")),
+            ("$ 1.234,56 x kg", Decimal("1234.56")),
+            ("12,", Decimal("12")),
+            ("$\xa01.234,56", Decimal("1234.56")),
+            ("$ ,", None),
+            ("$ .", None),
+            ("—", None),
+            ("Sin stock", None),
+            ("", None),
+            (None, None),
+        ]
+        for price_text, expected in cases:
+            with self.subTest(price_text=price_text):
+                self.assertEqual(self.scraper._parse_price(price_text), expected)
+
+    def test_canonical_product_url_matches_urlsplit(self):
+        urls = [
+            "https://www.laanonima.com.ar/producto/art_1_arroz?x=1#ficha",
+            "https://www.laanonima.com.ar/art_1#f?x",
+            "http://www.laanonima.com.ar/a;p?q",
+            "https:///art_3",
+            "http:///x",
+            "HTTPS://WWW.LAANONIMA.COM.AR/a?q",
+            "//www.laanonima.com.ar/a?q",
+            "/a/./b?q",
+            "/a/../b#x",
+            "https://www.laanonima.com.ar/a\tb?q",
+            "https://www.laanonima.com.ar/a\nb",
+            "https://www.laanonima.com.ar/a/b ",
+            "  https://www.laanonima.com.ar/a",
+            "https://www.laanonima.com.ar/a?",
+            "https://www.laanonima.com.ar?x",
+            "https://user@www.laanonima.com.ar:8080/a?x",
+            "https://www.laanonima.com.ar/a%3Fb?x",
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                parsed = urlsplit(url)
+                self.assertEqual(
+                    self.scraper._canonical_product_url(url),
+                    urlunsplit((parsed.scheme, parsed.netloc, parsed.path, "", "")),
+                )
+        self.assertEqual(self.scraper._canonical_product_url(None), "")
+        self.assertEqual(self.scraper._canonical_product_url(""), "")
+
+    def test_absolute_product_url_matches_urljoin(self):
+        base = "https://www.laanonima.com.ar/"
+        hrefs = [
+            "/producto/art_1_arroz",
+            "//cdn.example.com/art_2",
+            "/a/./b",
+            "/a/../b",
+            "/a/b/..",
+            "/a/.hidden",
+            "/a;p=1/b",
+            "/a/b;v?q=1",
+            "/a/b?x=1#frag",
+            "/a\tb",
+            "/a\x00b",
+            "/a/b\n",
+            " /a/b",
+            "/a/b ",
+            "/a//b",
+            "producto/art_3",
+            "?q=1",
+            "#top",
+            "",
+            "https:///art_4",
+            "https://www.laanonima.com.ar/art_5?x",
+        ]
+        for href in hrefs:
+            with self.subTest(href=href):
+                self.assertEqual(self.scraper._absolute_product_url(href), urljoin(base, href))
+
     def test_detect_closed_target_error_message(self):
         exc = RuntimeError("Target page, context or browser has been closed")
         self.assertTrue(self.scraper._is_closed_target_error(exc))
@@ -119,6 +248,73 @@ class TestScraperContract(unittest.TestCase):
         self.assertTrue(parsed["url_valid"])
         self.assertIn("/art_98765_arroz", parsed["url"])
 
+    def test_batched_search_results_match_per_card_fallback(self):
+        cards = [
+            ("Arroz Largo Fino 1 kg", "$ 1.234,56", "/producto/art_1_arroz"),
+            ("Arroz Integral 1 kg", "Consultar", "/producto/art_2_arroz"),
+            ("Arroz Parboil 1 kg", "$ 999,00", None),
+            ("Arroz Yamani 1 kg", "$ 2.100,00", "/producto/art_4_arroz"),
+        ]
+        payload_cards = [
+            {
+                "name": name,
+                "price": price,
+                "old_price": None,
+                "unit_price": None,
+                "href": href,
+                "out_of_stock": False,
+                "card_text": "",
+            }
+            for name, price, href in cards
+        ]
+        elements = []
+        for name, price, href in cards:
+            selectors = {
+                ".titulo": FakeLeafLocator(text=name),
+                ".precio": FakeLeafLocator(text=price),
+                ".sin-stock": FakeLeafLocator(count=0),
+            }
+            if href is not None:
+                selectors["a[href*='producto']"] = FakeLeafLocator(attributes={"href": href})
+            elements.append(FakeProductElement(selectors))
+
+        self.scraper.max_results_per_search = 3
+        list_selectors = [".producto-item", ".producto"]
+        card_selectors = self.scraper._card_selectors()
+
+        batched_page = FakeSearchPage(cards=payload_cards)
+        self.scraper.page = batched_page
+        batched_found, batched = self.scraper._parse_search_results(list_selectors, card_selectors)
+
+        self.scraper.page = FakeSearchPage(elements=elements, list_selector=".producto-item")
+        fallback_found, fallback = self.scraper._parse_search_results(list_selectors, card_selectors)
+
+        self.assertEqual(batched_page.evaluate_calls, 1)
+        self.assertEqual(batched_found, 4)
+        self.assertEqual(fallback_found, 4)
+        self.assertEqual(len(batched), 3)
+        self.assertEqual(batched, fallback)
+
+        by_name = {product["name"]: product for product in batched}
+        self.assertNotIn("Arroz Yamani 1 kg", by_name)
+        self.assertEqual(by_name["Arroz Largo Fino 1 kg"]["price"], Decimal("1234.56"))
+        self.assertTrue(by_name["Arroz Largo Fino 1 kg"]["url_valid"])
+        self.assertIsNone(by_name["Arroz Integral 1 kg"]["price"])
+        self.assertEqual(by_name["Arroz Parboil 1 kg"]["url"], "")
+        self.assertFalse(by_name["Arroz Parboil 1 kg"]["url_valid"])
+
+    def test_prepared_basket_item_cached_only_with_explicit_id(self):
+        item = {"id": "arroz_1kg", "keywords": ["Arroz"], "unit": "kg", "quantity": 1}
+        prepared = self.scraper._prepare_basket_item(item)
+        self.assertIs(self.scraper._prepare_basket_item(dict(item)), prepared)
+
+        unnamed = {"name": "Arroz largo fino", "keywords": ["Arroz"]}
+        first = self.scraper._prepare_basket_item(unnamed)
+        self.assertIsNot(self.scraper._prepare_basket_item(unnamed), first)
+        renamed = self.scraper._prepare_basket_item({**unnamed, "keywords": ["Fideos"]})
+        self.assertEqual(renamed["keywords"], ("fideos",))
+        self.assertEqual(list(self.scraper._basket_item_cache), ["arroz_1kg"])
+
     def test_select_tiered_candidates_returns_low_mid_high(self):
         basket_item = {"name": "Arroz", "keywords": ["arroz"], "quantity": 1, "unit": "kg"}
         search_results = [
@@ -301,6 +301,28 @@ class TestWebPublish(unittest.TestCase):
         self.assertIn('href="./tracker-ui.css?v=', tracker_html)
         self.assertIn('href="./tracker-ui.css?v=', month_run_html)
 
+    def test_web_publish_builds_product_pages_from_jsonl_details(self):
+        now = datetime.now(timezone.utc)
+        html_path, metadata_path = self._write_report("2026-01", "2026-02", now)
+        products_dir = self.report_dir / "products"
+        products_dir.mkdir(parents=True, exist_ok=True)
+        records = [
+            {"canonical_id": "leche/1l", "product_name": "Leche entera", "monthly_series": []},
+            {"canonical_id": "arroz_1kg", "product_name": "Arroz largo fino", "monthly_series": []},
+        ]
+        (products_dir / "products.jsonl").write_text(
+            "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records),
+            encoding="utf-8",
+        )
+
+        publisher = StaticWebPublisher(self.config)
+        publisher.report_dir = self.report_dir
+        publisher.publish(preferred_html=str(html_path), preferred_metadata=str(metadata_path))
+
+        leche_html = (self.output_dir / "tracker" / "leche_1l" / "index.html").read_text(encoding="utf-8")
+        self.assertIn("Leche entera", leche_html)
+        self.assertTrue((self.output_dir / "tracker" / "arroz_1kg" / "index.html").exists())
+
     def test_history_keeps_multiple_runs_same_month(self):
         now = datetime.now(timezone.utc)
         html_a, meta_a = self._write_report("2026-01", "2026-02", now - timedelta(hours=2))